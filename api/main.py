@@ -247,6 +247,8 @@ async def startup_event():
 async def shutdown_event():
     """Application shutdown event handler."""
     logger.info("Shutting down application")
+    from engines.data_collector import PriceDataCollector
+    await PriceDataCollector.close_shared_session()
 
 
 @app.get("/")
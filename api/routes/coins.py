@@ -1,10 +1,12 @@
 """
 Coin helper API endpoints.
 """
-from fastapi import APIRouter, HTTPException, Request
-from typing import List, Dict
-from engines.data_collector import DataCollector
+from fastapi import APIRouter, HTTPException, Request, Query
+from typing import List, Dict, Optional
+from engines.data_collector import DataCollector, APIUnavailableError
+from api.validation import is_coin_shape_valid, normalize_coin_symbol
 from utils.logger import setup_logger
+import asyncio
 import uuid
 
 logger = setup_logger(__name__)
@@ -22,6 +24,47 @@ SUPPORTED_COINS = [
     "MANA", "AXS", "GALA", "ENJ", "CHZ", "THETA", "FTM", "AAVE", "MKR", "SNX",
     "CRV", "COMP", "YFI", "SUSHI", "BAL", "1INCH", "LRC", "ZRX", "KNC", "REN"
 ]
+SUPPORTED_COINS_SET = frozenset(SUPPORTED_COINS)
+
+
+async def _fetch_price_info(symbol: str) -> Optional[Dict]:
+    """
+    Fetch latest price information for a supported coin from its 1h candles.
+    
+    Args:
+        symbol: Normalized, supported coin symbol
+        
+    Returns:
+        Price information dict, or None if no price data is available
+    """
+    try:
+        candles = await data_collector.fetch_ohlcv(symbol, '1h')
+    except APIUnavailableError:
+        return None
+    
+    if not candles:
+        return None
+    
+    # Get latest candle
+    latest = candles[-1]
+    
+    # Calculate 24h change if we have enough data
+    change_24h = None
+    if len(candles) >= 24:
+        price_24h_ago = candles[-24]['close']
+        current_price = latest['close']
+        change_24h = ((current_price - price_24h_ago) / price_24h_ago) * 100
+    
+    timestamp = latest['timestamp']
+    volume = latest.get('volume')
+    
+    return {
+        "symbol": symbol,
+        "price": float(latest['close']),
+        "timestamp": timestamp.isoformat() if hasattr(timestamp, 'isoformat') else str(timestamp),
+        "24h_change": float(change_24h) if change_24h is not None else None,
+        "volume": float(volume) if volume is not None else None
+    }
 
 
 @router.get("", response_model=List[str])
@@ -70,7 +113,7 @@ async def get_coin_price(
     """
     request_id = getattr(http_request.state, "request_id", str(uuid.uuid4()))
     
-    symbol = symbol.upper().strip()
+    symbol = normalize_coin_symbol(symbol)
     
     logger.info(
         f"Fetching price for {symbol}",
@@ -78,39 +121,29 @@ async def get_coin_price(
     )
     
     try:
+        # Validate coin format before the supported list lookup
+        if not is_coin_shape_valid(symbol):
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid coin symbol format: {symbol}"
+            )
+        
         # Validate coin
-        if symbol not in SUPPORTED_COINS:
+        if symbol not in SUPPORTED_COINS_SET:
             raise HTTPException(
                 status_code=400,
                 detail=f"Coin {symbol} is not supported. Supported coins: {', '.join(SUPPORTED_COINS[:10])}..."
             )
         
-        # Fetch price data
-        price_data = data_collector.fetch_price_data(symbol, '1h')
+        price_info = await _fetch_price_info(symbol)
         
-        if price_data.empty:
+        if price_info is None:
             raise HTTPException(
                 status_code=404,
                 detail=f"Price data not available for {symbol}"
             )
         
-        # Get latest price
-        latest = price_data.iloc[-1]
-        
-        # Calculate 24h change if we have enough data
-        change_24h = None
-        if len(price_data) >= 24:
-            price_24h_ago = price_data.iloc[-24]['close']
-            current_price = latest['close']
-            change_24h = ((current_price - price_24h_ago) / price_24h_ago) * 100
-        
-        return {
-            "symbol": symbol,
-            "price": float(latest['close']),
-            "timestamp": latest.name.isoformat() if hasattr(latest.name, 'isoformat') else str(latest.name),
-            "24h_change": float(change_24h) if change_24h is not None else None,
-            "volume": float(latest['volume']) if 'volume' in latest else None
-        }
+        return price_info
         
     except HTTPException:
         raise
@@ -124,3 +157,59 @@ async def get_coin_price(
             status_code=500,
             detail=f"Failed to fetch price: {str(e)}"
         )
+
+
+@router.get("/prices", response_model=Dict[str, Optional[Dict]])
+async def get_coin_prices(
+    http_request: Request,
+    coins: str = Query(..., description="Comma separated coin symbols, e.g. BTC,ETH")
+):
+    """
+    Get current prices for several coins in one request.
+    
+    - **coins**: Comma separated coin symbols (e.g., BTC,ETH,SOL)
+    
+    Returns a mapping of symbol to price information (same shape as
+    /api/coins/{symbol}/price). Symbols without price data map to null.
+    Duplicate symbols are fetched once; the remaining symbols are fetched
+    concurrently.
+    """
+    request_id = getattr(http_request.state, "request_id", str(uuid.uuid4()))
+    
+    # Normalize and dedupe while preserving request order
+    symbols = list(dict.fromkeys(
+        normalize_coin_symbol(coin) for coin in coins.split(",") if coin.strip()
+    ))
+    
+    logger.info(
+        f"Fetching prices for {len(symbols)} coins",
+        extra={"request_id": request_id, "symbols": symbols}
+    )
+    
+    if not symbols:
+        raise HTTPException(
+            status_code=400,
+            detail="At least one coin symbol is required"
+        )
+    
+    invalid = [s for s in symbols if not is_coin_shape_valid(s) or s not in SUPPORTED_COINS_SET]
+    if invalid:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Coins not supported: {', '.join(invalid)}"
+        )
+    
+    try:
+        price_infos = await asyncio.gather(*(_fetch_price_info(symbol) for symbol in symbols))
+        return dict(zip(symbols, price_infos))
+        
+    except Exception as e:
+        logger.error(
+            f"Error fetching prices for {symbols}: {str(e)}",
+            extra={"request_id": request_id, "symbols": symbols},
+            exc_info=True
+        )
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to fetch prices: {str(e)}"
+        )
@@ -0,0 +1,29 @@
+"""
+Lightweight request validation helpers shared by API routes.
+"""
+import re
+
+
+# Coin tickers are short uppercase alphanumeric symbols (e.g. BTC, 1INCH)
+COIN_SYMBOL_PATTERN = re.compile(r"[A-Z0-9]{1,10}")
+
+
+def normalize_coin_symbol(symbol: str) -> str:
+    """Normalize a user supplied coin symbol (uppercase, stripped)."""
+    return symbol.upper().strip()
+
+
+def is_coin_shape_valid(symbol: str) -> bool:
+    """
+    Cheap format check for coin symbols.
+    
+    Rejects anything that cannot possibly be a supported ticker before
+    any list lookup or data collection is attempted.
+    
+    Args:
+        symbol: Raw coin symbol
+        
+    Returns:
+        True if the symbol looks like a coin ticker
+    """
+    return COIN_SYMBOL_PATTERN.fullmatch(normalize_coin_symbol(symbol)) is not None
@@ -20,6 +20,10 @@ logger = setup_logger(__name__)
 class AnalysisHistoryManager:
     """Manages analysis history operations."""
     
+    # Rows per INSERT batch; keeps multi-row statements under SQLite's
+    # bound-parameter limit
+    BULK_INSERT_CHUNK_SIZE = 500
+    
     def __init__(self, user_id: str, db_session_factory=None):
         """
         Initialize Analysis History Manager.
@@ -49,26 +53,8 @@ class AnalysisHistoryManager:
         """
         try:
             with self.db_session_factory() as db:
-                # Convert Pydantic models to dict with JSON-serializable values
-                technical_data = analysis.technical_results.model_dump(mode='json')
-                fundamental_data = analysis.fundamental_results.model_dump(mode='json')
-                signal_data = analysis.signal.model_dump(mode='json')
-                
                 # Create database record
-                db_analysis = Analysis(
-                    id=analysis.id,
-                    user_id=self.user_id,
-                    coin=analysis.coin,
-                    timeframe=analysis.timeframe,
-                    timestamp=analysis.timestamp,
-                    technical_data=technical_data,
-                    fundamental_data=fundamental_data,
-                    signal=signal_data,
-                    ai_report=analysis.ai_report,
-                    price_at_analysis=float(analysis.price_at_analysis),
-                    price_after_period=float(analysis.price_after_period) if analysis.price_after_period else None,
-                    actual_outcome=analysis.actual_outcome
-                )
+                db_analysis = Analysis(**self._analysis_to_row(analysis))
                 
                 db.add(db_analysis)
                 db.commit()
@@ -80,6 +66,68 @@ class AnalysisHistoryManager:
             logger.error(f"Error saving analysis: {str(e)}")
             raise
     
+    def save_analyses(self, analyses: List[AnalysisResult]) -> List[str]:
+        """
+        Save several analysis results in a single transaction.
+        
+        Rows are written with bulk Core INSERTs (executemany) in chunks of
+        BULK_INSERT_CHUNK_SIZE instead of one ORM flush per analysis.
+        
+        Args:
+            analyses: Complete analysis results
+            
+        Returns:
+            IDs of saved analyses, in input order
+            
+        Validates: Requirement 16.1
+        """
+        if not analyses:
+            return []
+        
+        try:
+            rows = [self._analysis_to_row(analysis) for analysis in analyses]
+            
+            with self.db_session_factory() as db:
+                for start in range(0, len(rows), self.BULK_INSERT_CHUNK_SIZE):
+                    db.execute(
+                        Analysis.__table__.insert(),
+                        rows[start:start + self.BULK_INSERT_CHUNK_SIZE]
+                    )
+                db.commit()
+            
+            logger.info(f"Saved {len(rows)} analyses for user {self.user_id}")
+            return [row['id'] for row in rows]
+            
+        except Exception as e:
+            logger.error(f"Error saving analyses: {str(e)}")
+            raise
+    
+    def _analysis_to_row(self, analysis: AnalysisResult) -> Dict:
+        """
+        Convert AnalysisResult to analyses table column values.
+        
+        Args:
+            analysis: Complete analysis result
+            
+        Returns:
+            Dict of column values
+        """
+        # Convert Pydantic models to dict with JSON-serializable values
+        return {
+            'id': analysis.id,
+            'user_id': self.user_id,
+            'coin': analysis.coin,
+            'timeframe': analysis.timeframe,
+            'timestamp': analysis.timestamp,
+            'technical_data': analysis.technical_results.model_dump(mode='json'),
+            'fundamental_data': analysis.fundamental_results.model_dump(mode='json'),
+            'signal': analysis.signal.model_dump(mode='json'),
+            'ai_report': analysis.ai_report,
+            'price_at_analysis': float(analysis.price_at_analysis),
+            'price_after_period': float(analysis.price_after_period) if analysis.price_after_period else None,
+            'actual_outcome': analysis.actual_outcome
+        }
+    
     def get_analysis(self, analysis_id: str) -> Optional[AnalysisResult]:
         """
         Retrieve a specific analysis by ID.
@@ -3,11 +3,14 @@ Backtesting Engine for testing trading strategies on historical data.
 Implements core backtesting algorithm, trade simulation, and metrics calculation.
 """
 import uuid
+import json
+import math
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, Union
 from datetime import datetime, timedelta
 from utils.logger import logger
+from utils.jit import njit
 from models.schemas import (
     BacktestParameters, BacktestTrade, BacktestMetrics, BacktestResult,
     BacktestComparison, Signal, SignalType, IndicatorResults, OverallSentiment
@@ -18,6 +21,115 @@ from engines.signal_generator import SignalGenerator
 from engines.data_collector import PriceDataCollector
 import asyncio
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _replace_non_finite(value):
+    """Recursively replace NaN/inf floats with None so the report is valid JSON."""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _replace_non_finite(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_replace_non_finite(item) for item in value]
+    return value
+
+
+@njit(cache=True)
+def _max_drawdown_kernel(equity: np.ndarray) -> Tuple[float, float]:
+    """
+    Running-peak max drawdown over an equity array (JIT compiled if available).
+    
+    Args:
+        equity: Equity values in chronological order (non-empty)
+    
+    Returns:
+        Tuple of (max_drawdown_absolute, max_drawdown_percent)
+    """
+    peak = equity[0]
+    max_drawdown = 0.0
+    max_drawdown_percent = 0.0
+    
+    for i in range(equity.shape[0]):
+        value = equity[i]
+        if value > peak:
+            peak = value
+        
+        drawdown = peak - value
+        if drawdown > max_drawdown:
+            max_drawdown = drawdown
+            max_drawdown_percent = drawdown / peak * 100.0 if peak > 0 else 0.0
+    
+    return max_drawdown, max_drawdown_percent
+
+
+def _trade_durations_ns(trades: List[BacktestTrade]) -> np.ndarray:
+    """
+    Holding period of each trade as int64 nanoseconds.
+    
+    Entry and exit dates are converted to epoch nanoseconds once, so the
+    durations come from one vectorized int64 subtraction instead of a
+    timedelta allocation per trade.
+    
+    Args:
+        trades: Closed trades
+    
+    Returns:
+        int64 array of (exit_date - entry_date) in nanoseconds
+    """
+    entry_ns = pd.DatetimeIndex([t.entry_date for t in trades]).asi8
+    exit_ns = pd.DatetimeIndex([t.exit_date for t in trades]).asi8
+    return exit_ns - entry_ns
+
+
+class EquityCurve:
+    """
+    Equity curve stored as parallel timestamp and equity columns.
+    
+    Metric calculations reduce over the contiguous float64 `values` array.
+    Timestamps are never reduced, so they keep the original datetime objects
+    (including any tzinfo) and round-trip unchanged into BacktestResult.
+    """
+    
+    def __init__(self, timestamps: List[datetime], values: np.ndarray):
+        """
+        Initialize equity curve.
+        
+        Args:
+            timestamps: datetime objects, as supplied
+            values: float64 equity array of the same length
+        """
+        self.timestamps = timestamps
+        self.values = values
+    
+    def __len__(self) -> int:
+        return int(self.values.shape[0])
+    
+    @classmethod
+    def from_columns(cls, timestamps: List[datetime], values: List[float]) -> "EquityCurve":
+        """Build from separate timestamp and equity lists."""
+        return cls(list(timestamps), np.array(values, dtype=np.float64))
+    
+    @classmethod
+    def from_list_of_tuples(
+        cls,
+        equity_curve: Union[List[Tuple[datetime, float]], "EquityCurve"]
+    ) -> "EquityCurve":
+        """Build from (timestamp, equity) tuples; EquityCurve input is returned as-is."""
+        if isinstance(equity_curve, cls):
+            return equity_curve
+        if not equity_curve:
+            return cls.from_columns([], [])
+        timestamps, values = zip(*equity_curve)
+        return cls.from_columns(list(timestamps), list(values))
+    
+    def to_list_of_tuples(self) -> List[Tuple[datetime, float]]:
+        """Convert back to (timestamp, equity) tuples with the original datetime objects."""
+        return list(zip(self.timestamps, self.values.tolist()))
+
 
 class BacktestingEngine:
     """
@@ -181,7 +293,8 @@ class BacktestingEngine:
         
         # Initialize backtest state
         trades: List[BacktestTrade] = []
-        equity_curve: List[Tuple[datetime, float]] = []
+        equity_timestamps: List[datetime] = []
+        equity_values: List[float] = []
         current_capital = initial_capital
         current_position = None  # None or dict with entry details
         
@@ -319,7 +432,8 @@ class BacktestingEngine:
                     )
                     equity += unrealized_pl
                 
-                equity_curve.append((current_timestamp, equity))
+                equity_timestamps.append(current_timestamp)
+                equity_values.append(equity)
                 
             except Exception as e:
                 logger.warning(f"Error analyzing data point at {current_timestamp}: {e}")
@@ -358,6 +472,7 @@ class BacktestingEngine:
         )
         
         # Calculate metrics
+        equity_curve = EquityCurve.from_columns(equity_timestamps, equity_values)
         metrics = self.calculate_metrics(trades, initial_capital, equity_curve)
         
         # Create result
@@ -369,7 +484,7 @@ class BacktestingEngine:
             parameters=parameters,
             trades=trades,
             metrics=metrics,
-            equity_curve=equity_curve
+            equity_curve=equity_curve.to_list_of_tuples()
         )
         
         return result
@@ -378,7 +493,7 @@ class BacktestingEngine:
         self,
         trades: List[BacktestTrade],
         initial_capital: float,
-        equity_curve: List[Tuple[datetime, float]]
+        equity_curve: Union[List[Tuple[datetime, float]], EquityCurve]
     ) -> BacktestMetrics:
         """
         Calculate performance metrics from trades and equity curve.
@@ -386,7 +501,7 @@ class BacktestingEngine:
         Args:
             trades: List of executed trades
             initial_capital: Initial capital
-            equity_curve: Equity curve data
+            equity_curve: Equity curve ((timestamp, equity) tuples or EquityCurve)
         
         Returns:
             Calculated metrics
@@ -409,30 +524,35 @@ class BacktestingEngine:
                 profit_factor=0.0
             )
         
-        # Count winning and losing trades
-        winning_trades = sum(1 for t in trades if t.profit_loss > 0)
-        losing_trades = sum(1 for t in trades if t.profit_loss <= 0)
+        # Gather per-trade values into parallel arrays once, then reduce
+        equity_curve = EquityCurve.from_list_of_tuples(equity_curve)
         total_trades = len(trades)
+        profit_losses = np.fromiter(
+            (t.profit_loss for t in trades), dtype=np.float64, count=total_trades
+        )
+        durations_ns = _trade_durations_ns(trades)
+        
+        # Count winning and losing trades
+        winning_trades, losing_trades = self._count_wins_losses(profit_losses)
         
         # Win rate
         win_rate = (winning_trades / total_trades * 100) if total_trades > 0 else 0.0
         
         # Total profit/loss
-        total_profit_loss = sum(t.profit_loss for t in trades)
+        total_profit_loss = float(profit_losses.sum())
         total_profit_loss_percent = (total_profit_loss / initial_capital) * 100
         
         # Maximum drawdown
         max_drawdown, max_drawdown_percent = self._calculate_max_drawdown(equity_curve)
         
         # Average trade duration
-        trade_durations = [(t.exit_date - t.entry_date) for t in trades]
-        average_trade_duration = sum(trade_durations, timedelta(0)) / len(trade_durations)
+        average_trade_duration = timedelta(microseconds=float(durations_ns.mean()) / 1000)
         
         # Sharpe ratio
         sharpe_ratio = self._calculate_sharpe_ratio(trades, equity_curve)
         
         # Profit factor
-        profit_factor = self._calculate_profit_factor(trades)
+        profit_factor = self._calculate_profit_factor(profit_losses)
         
         metrics = BacktestMetrics(
             total_trades=total_trades,
@@ -458,43 +578,29 @@ class BacktestingEngine:
     
     def _calculate_max_drawdown(
         self,
-        equity_curve: List[Tuple[datetime, float]]
+        equity_curve: Union[List[Tuple[datetime, float]], EquityCurve]
     ) -> Tuple[float, float]:
         """
         Calculate maximum drawdown from equity curve.
         
         Args:
-            equity_curve: List of (timestamp, equity) tuples
+            equity_curve: (timestamp, equity) tuples or EquityCurve
         
         Returns:
             Tuple of (max_drawdown_absolute, max_drawdown_percent)
         """
-        if not equity_curve:
+        if len(equity_curve) == 0:
             return 0.0, 0.0
         
-        equity_values = [e[1] for e in equity_curve]
-        
-        max_drawdown = 0.0
-        max_drawdown_percent = 0.0
-        peak = equity_values[0]
-        
-        for equity in equity_values:
-            if equity > peak:
-                peak = equity
-            
-            drawdown = peak - equity
-            drawdown_percent = (drawdown / peak * 100) if peak > 0 else 0.0
-            
-            if drawdown > max_drawdown:
-                max_drawdown = drawdown
-                max_drawdown_percent = drawdown_percent
+        equity_curve = EquityCurve.from_list_of_tuples(equity_curve)
+        max_drawdown, max_drawdown_percent = _max_drawdown_kernel(equity_curve.values)
         
-        return max_drawdown, max_drawdown_percent
+        return float(max_drawdown), float(max_drawdown_percent)
     
     def _calculate_sharpe_ratio(
         self,
         trades: List[BacktestTrade],
-        equity_curve: List[Tuple[datetime, float]],
+        equity_curve: Union[List[Tuple[datetime, float]], EquityCurve],
         risk_free_rate: float = 0.02
     ) -> float:
         """
@@ -502,7 +608,7 @@ class BacktestingEngine:
         
         Args:
             trades: List of trades
-            equity_curve: Equity curve data
+            equity_curve: Equity curve ((timestamp, equity) tuples or EquityCurve)
             risk_free_rate: Annual risk-free rate (default 2%)
         
         Returns:
@@ -511,16 +617,13 @@ class BacktestingEngine:
         if not trades or len(equity_curve) < 2:
             return 0.0
         
-        # Calculate returns
-        returns = []
-        for i in range(1, len(equity_curve)):
-            prev_equity = equity_curve[i-1][1]
-            curr_equity = equity_curve[i][1]
-            if prev_equity > 0:
-                ret = (curr_equity - prev_equity) / prev_equity
-                returns.append(ret)
+        # Calculate returns between consecutive points with positive prior equity
+        values = EquityCurve.from_list_of_tuples(equity_curve).values
+        prev_equity = values[:-1]
+        positive = prev_equity > 0
+        returns = (values[1:][positive] - prev_equity[positive]) / prev_equity[positive]
         
-        if not returns:
+        if returns.size == 0:
             return 0.0
         
         # Calculate average return and standard deviation
@@ -537,27 +640,52 @@ class BacktestingEngine:
         
         return float(sharpe)
     
-    def _calculate_profit_factor(self, trades: List[BacktestTrade]) -> float:
+    def _calculate_profit_factor(
+        self,
+        trades: Union[List[BacktestTrade], np.ndarray]
+    ) -> float:
         """
         Calculate profit factor (gross profit / gross loss).
         
         Args:
-            trades: List of trades
+            trades: List of trades, or an array of per-trade profit/loss values
         
         Returns:
             Profit factor
         """
-        if not trades:
+        if len(trades) == 0:
             return 0.0
         
-        gross_profit = sum(t.profit_loss for t in trades if t.profit_loss > 0)
-        gross_loss = abs(sum(t.profit_loss for t in trades if t.profit_loss < 0))
+        if isinstance(trades, np.ndarray):
+            profit_losses = trades
+        else:
+            profit_losses = np.fromiter(
+                (t.profit_loss for t in trades), dtype=np.float64, count=len(trades)
+            )
+        
+        # Gross profit and gross loss as masked sums over one array
+        gross_profit = float(np.where(profit_losses > 0, profit_losses, 0.0).sum())
+        gross_loss = float(-np.where(profit_losses < 0, profit_losses, 0.0).sum())
         
         if gross_loss == 0:
             return float('inf') if gross_profit > 0 else 0.0
         
         return gross_profit / gross_loss
     
+    @staticmethod
+    def _count_wins_losses(profit_losses: np.ndarray) -> Tuple[int, int]:
+        """
+        Count winning (P/L > 0) and losing (P/L <= 0) trades.
+        
+        Args:
+            profit_losses: Per-trade profit/loss values
+        
+        Returns:
+            Tuple of (winning_trades, losing_trades)
+        """
+        winning_trades = int(np.count_nonzero(profit_losses > 0))
+        return winning_trades, int(profit_losses.shape[0]) - winning_trades
+    
     def compare_backtests(self, backtest_ids: List[str]) -> BacktestComparison:
         """
         Compare multiple backtest results.
@@ -636,3 +764,25 @@ class BacktestingEngine:
         
         logger.info(f"Generated backtest report for {result.id}")
         return report
+    
+    def generate_backtest_report_json(self, result: BacktestResult) -> str:
+        """
+        Generate the backtest report serialized as a JSON string.
+        
+        Uses orjson when installed (NumPy values serialized natively),
+        falling back to the standard library json module. Non-finite floats
+        (e.g. an infinite profit factor when no trade lost) are written as
+        null by both backends, so the output is always strict JSON.
+        
+        Args:
+            result: Backtest result
+        
+        Returns:
+            JSON encoded report
+        """
+        report = _replace_non_finite(self.generate_backtest_report(result))
+        
+        if orjson is not None:
+            return orjson.dumps(report, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+        
+        return json.dumps(report, allow_nan=False)
@@ -4,8 +4,10 @@ Implements retry mechanism, failover, and caching.
 """
 import aiohttp
 import asyncio
+import random
+import weakref
 import requests
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime, timedelta
 from utils.config import settings
 from utils.cache import cache
@@ -23,43 +25,145 @@ class APIUnavailableError(DataCollectorError):
     pass
 
 
-class PriceDataCollector:
-    """Collects price and OHLCV data from multiple sources with failover."""
+class RetryMixin:
+    """
+    Async retry with capped, jittered exponential backoff and a per-source
+    circuit breaker.
     
-    def __init__(self):
-        """Initialize price data collector."""
-        self.binance_base_url = "https://api.binance.com/api/v3"
-        self.coingecko_base_url = "https://api.coingecko.com/api/v3"
-        self.max_retries = 3
-        self.retry_delay = 1  # seconds
-        self.timeout = 10  # seconds
+    Collectors set `max_retries` and `retry_delay` in their constructor and
+    initialize `_failure_counts` (consecutive failures per source) to {}.
+    Once a source has failed `circuit_breaker_threshold` requests in a row,
+    further requests to it get a single attempt with no backoff sleeps, so
+    callers fall through to their fallback source immediately. The first
+    success closes the breaker again.
+    """
     
-    async def _retry_request(self, func, *args, **kwargs) -> Optional[Any]:
+    max_retries = 3
+    retry_delay = 1  # seconds, base of the exponential backoff
+    max_retry_delay = 30  # seconds, cap on a single backoff sleep
+    timeout = 10  # seconds; collectors set their own HTTP timeout in __init__
+    circuit_breaker_threshold = 5
+    
+    async def _retry_request(
+        self,
+        func,
+        *args,
+        max_attempts: Optional[int] = None,
+        base: Optional[float] = None,
+        cap: Optional[float] = None,
+        attempt_timeout: Optional[float] = None,
+        **kwargs
+    ) -> Optional[Any]:
         """
-        Execute request with exponential backoff retry.
+        Execute request with jittered exponential backoff retry.
+        
+        The i-th retry waits min(cap, base * 2**i) plus a random jitter in
+        [0, base], so concurrent callers retrying the same failed upstream
+        spread out instead of retrying in lockstep. An attempt that takes
+        longer than `attempt_timeout` is abandoned and counts as a failure, so
+        a hanging upstream fails over instead of stalling the caller.
         
         Args:
             func: Async function to execute
             *args: Function arguments
+            max_attempts: Attempt limit (default: max_retries)
+            base: Backoff base in seconds (default: retry_delay)
+            cap: Maximum backoff in seconds (default: max_retry_delay)
+            attempt_timeout: Per-attempt time limit in seconds
+                (default: the collector's HTTP timeout)
             **kwargs: Function keyword arguments
         
         Returns:
             Function result or None if all retries failed
         """
-        for attempt in range(self.max_retries):
+        max_attempts = self.max_retries if max_attempts is None else max_attempts
+        base = self.retry_delay if base is None else base
+        cap = self.max_retry_delay if cap is None else cap
+        attempt_timeout = self.timeout if attempt_timeout is None else attempt_timeout
+        
+        source = getattr(func, "__name__", repr(func))
+        failures = self._failure_counts
+        if failures.get(source, 0) >= self.circuit_breaker_threshold:
+            # Circuit open: probe once, don't stall the caller's failover
+            max_attempts = 1
+        
+        for attempt in range(max_attempts):
             try:
-                return await func(*args, **kwargs)
+                result = await asyncio.wait_for(func(*args, **kwargs), timeout=attempt_timeout)
+                failures.pop(source, None)
+                return result
             except Exception as e:
-                if attempt < self.max_retries - 1:
-                    delay = self.retry_delay * (2 ** attempt)  # Exponential backoff
+                reason = str(e) or type(e).__name__  # TimeoutError has no message
+                if attempt < max_attempts - 1:
+                    delay = min(cap, base * (2 ** attempt)) + random.uniform(0, base)
                     logger.warning(
-                        f"Request failed (attempt {attempt + 1}/{self.max_retries}): {e}. "
-                        f"Retrying in {delay}s..."
+                        f"Request failed (attempt {attempt + 1}/{max_attempts}): {reason}. "
+                        f"Retrying in {delay:.2f}s..."
                     )
                     await asyncio.sleep(delay)
                 else:
-                    logger.error(f"Request failed after {self.max_retries} attempts: {e}")
+                    failures[source] = failures.get(source, 0) + 1
+                    logger.error(f"Request failed after {max_attempts} attempts: {reason}")
                     return None
+
+
+class PriceDataCollector(RetryMixin):
+    """Collects price and OHLCV data from multiple sources with failover."""
+    
+    # Pooled HTTP session per event loop, shared by all instances
+    # (an aiohttp session cannot be used from a loop other than its own)
+    _shared_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.ClientSession]" = \
+        weakref.WeakKeyDictionary()
+    
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
+        """
+        Initialize price data collector.
+        
+        Args:
+            session: HTTP session to use (default: the pooled shared session)
+        """
+        self._session = session
+        self.binance_base_url = "https://api.binance.com/api/v3"
+        self.coingecko_base_url = "https://api.coingecko.com/api/v3"
+        self.max_retries = 3
+        self.retry_delay = 1  # seconds
+        self.timeout = 10  # seconds
+        self._failure_counts: Dict[str, int] = {}
+        self.hedge_delay = 0.5  # seconds before the secondary source is also queried
+        self.primary_timeout = 2.0  # seconds per Binance OHLCV attempt before failing over
+        self._refresh_tasks: Dict[Tuple[str, str], asyncio.Task] = {}  # in-flight SWR refreshes
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the HTTP session for source requests.
+        
+        Returns:
+            The session given to the constructor, otherwise the pooled
+            keep-alive session of the running event loop (created on first use)
+        """
+        if self._session is not None:
+            return self._session
+        
+        loop = asyncio.get_running_loop()
+        session = self._shared_sessions.get(loop)
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=100,
+                    limit_per_host=10,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=30
+                )
+            )
+            self._shared_sessions[loop] = session
+        return session
+    
+    @classmethod
+    async def close_shared_session(cls) -> None:
+        """Close the pooled HTTP session of the running event loop, if any."""
+        session = cls._shared_sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None and not session.closed:
+            await session.close()
     
     async def _fetch_binance_price(self, coin: str) -> Optional[float]:
         """
@@ -76,16 +180,15 @@ class PriceDataCollector:
         params = {"symbol": symbol}
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params, timeout=self.timeout) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        price = float(data.get("price", 0))
-                        logger.info(f"Fetched {coin} price from Binance: ${price}")
-                        return price
-                    else:
-                        logger.error(f"Binance API error: {response.status}")
-                        return None
+            async with self._get_session().get(url, params=params, timeout=self.timeout) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    price = float(data.get("price", 0))
+                    logger.info(f"Fetched {coin} price from Binance: ${price}")
+                    return price
+                else:
+                    logger.error(f"Binance API error: {response.status}")
+                    return None
         except Exception as e:
             logger.error(f"Error fetching price from Binance: {e}")
             return None
@@ -125,17 +228,16 @@ class PriceDataCollector:
             params["x_cg_pro_api_key"] = settings.COINGECKO_API_KEY
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params, timeout=self.timeout) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        price = data.get(coin_id, {}).get("usd")
-                        if price:
-                            logger.info(f"Fetched {coin} price from CoinGecko: ${price}")
-                            return float(price)
-                    else:
-                        logger.error(f"CoinGecko API error: {response.status}")
-                    return None
+            async with self._get_session().get(url, params=params, timeout=self.timeout) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    price = data.get(coin_id, {}).get("usd")
+                    if price:
+                        logger.info(f"Fetched {coin} price from CoinGecko: ${price}")
+                        return float(price)
+                else:
+                    logger.error(f"CoinGecko API error: {response.status}")
+                return None
         except Exception as e:
             logger.error(f"Error fetching price from CoinGecko: {e}")
             return None
@@ -221,25 +323,24 @@ class PriceDataCollector:
         }
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params, timeout=self.timeout) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        candles = []
-                        for candle in data:
-                            candles.append({
-                                "timestamp": datetime.fromtimestamp(candle[0] / 1000),
-                                "open": float(candle[1]),
-                                "high": float(candle[2]),
-                                "low": float(candle[3]),
-                                "close": float(candle[4]),
-                                "volume": float(candle[5])
-                            })
-                        logger.info(f"Fetched {len(candles)} OHLCV candles from Binance for {coin}")
-                        return candles
-                    else:
-                        logger.error(f"Binance OHLCV API error: {response.status}")
-                        return None
+            async with self._get_session().get(url, params=params, timeout=self.timeout) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    candles = []
+                    for candle in data:
+                        candles.append({
+                            "timestamp": datetime.fromtimestamp(candle[0] / 1000),
+                            "open": float(candle[1]),
+                            "high": float(candle[2]),
+                            "low": float(candle[3]),
+                            "close": float(candle[4]),
+                            "volume": float(candle[5])
+                        })
+                    logger.info(f"Fetched {len(candles)} OHLCV candles from Binance for {coin}")
+                    return candles
+                else:
+                    logger.error(f"Binance OHLCV API error: {response.status}")
+                    return None
         except Exception as e:
             logger.error(f"Error fetching OHLCV from Binance: {e}")
             return None
@@ -296,28 +397,130 @@ class PriceDataCollector:
             params["x_cg_pro_api_key"] = settings.COINGECKO_API_KEY
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params, timeout=self.timeout) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        candles = []
-                        for candle in data[-limit:]:  # Get last 'limit' candles
-                            candles.append({
-                                "timestamp": datetime.fromtimestamp(candle[0] / 1000),
-                                "open": float(candle[1]),
-                                "high": float(candle[2]),
-                                "low": float(candle[3]),
-                                "close": float(candle[4])
-                            })
-                        logger.info(f"Fetched {len(candles)} OHLCV candles from CoinGecko for {coin}")
-                        return candles
-                    else:
-                        logger.error(f"CoinGecko OHLCV API error: {response.status}")
-                        return None
+            async with self._get_session().get(url, params=params, timeout=self.timeout) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    candles = []
+                    for candle in data[-limit:]:  # Get last 'limit' candles
+                        candles.append({
+                            "timestamp": datetime.fromtimestamp(candle[0] / 1000),
+                            "open": float(candle[1]),
+                            "high": float(candle[2]),
+                            "low": float(candle[3]),
+                            "close": float(candle[4])
+                        })
+                    logger.info(f"Fetched {len(candles)} OHLCV candles from CoinGecko for {coin}")
+                    return candles
+                else:
+                    logger.error(f"CoinGecko OHLCV API error: {response.status}")
+                    return None
         except Exception as e:
             logger.error(f"Error fetching OHLCV from CoinGecko: {e}")
             return None
     
+    async def _race_sources(self, coin: str, timeframe: str, limit: int) -> Optional[List[Dict]]:
+        """
+        Fetch OHLCV from Binance, hedged by CoinGecko.
+        
+        Binance is queried first; if it has not produced candles within
+        `hedge_delay` seconds (or it failed sooner), CoinGecko is queried
+        concurrently. The first non-empty response wins; the other request
+        is cancelled and awaited so its connection is released.
+        
+        Args:
+            coin: Coin symbol (e.g., "BTC")
+            timeframe: Timeframe (e.g., "1h", "4h")
+            limit: Number of candles to fetch
+        
+        Returns:
+            List of OHLCV candles, an empty list if the sources returned no
+            candles, or None if both sources failed
+        """
+        primary = asyncio.create_task(
+            self._retry_request(
+                self._fetch_binance_ohlcv, coin, timeframe, limit,
+                attempt_timeout=self.primary_timeout
+            )
+        )
+        pending = {primary}
+        fallback = None
+        
+        try:
+            done, pending = await asyncio.wait(pending, timeout=self.hedge_delay)
+            if done:
+                candles = primary.result()
+                if candles:
+                    return candles
+                fallback = candles
+                logger.warning(f"Binance unavailable, trying CoinGecko for {coin} OHLCV")
+            else:
+                logger.info(f"Binance slow for {coin} OHLCV, hedging with CoinGecko")
+            
+            pending.add(asyncio.create_task(
+                self._retry_request(self._fetch_coingecko_ohlcv, coin, timeframe, limit)
+            ))
+            
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    candles = task.result()
+                    if candles:
+                        return candles
+                    if candles is not None:
+                        fallback = candles
+            
+            return fallback
+        finally:
+            # Cancel the losing request and wait for it to unwind so its
+            # HTTP session and connection are released before we return
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+    
+    def _schedule_ohlcv_refresh(self, coin: str, timeframe: str, limit: int) -> asyncio.Task:
+        """
+        Start a background OHLCV refresh unless one is already running.
+        
+        Args:
+            coin: Coin symbol (e.g., "BTC")
+            timeframe: Timeframe (e.g., "1h", "4h")
+            limit: Number of candles to fetch
+        
+        Returns:
+            The in-flight refresh task for this coin and timeframe
+        """
+        key = (coin, timeframe)
+        task = self._refresh_tasks.get(key)
+        if task is None:
+            task = asyncio.create_task(self._refresh_ohlcv(coin, timeframe, limit))
+            # Holding the task here also keeps it from being garbage collected
+            self._refresh_tasks[key] = task
+            task.add_done_callback(lambda _: self._refresh_tasks.pop(key, None))
+        return task
+    
+    async def _refresh_ohlcv(self, coin: str, timeframe: str, limit: int) -> None:
+        """
+        Re-fetch OHLCV from the sources and update the cache.
+        
+        Failures are logged and leave the stale cache entry in place.
+        
+        Args:
+            coin: Coin symbol (e.g., "BTC")
+            timeframe: Timeframe (e.g., "1h", "4h")
+            limit: Number of candles to fetch
+        """
+        try:
+            candles = await self._race_sources(coin, timeframe, limit)
+        except Exception as e:
+            logger.error(f"Background OHLCV refresh failed for {coin} {timeframe}: {e}")
+            return
+        
+        if candles is None:
+            logger.warning(f"Background OHLCV refresh found no source for {coin} {timeframe}")
+            return
+        cache.set_ohlcv(coin, timeframe, candles)
+    
     async def fetch_ohlcv(
         self,
         coin: str,
@@ -326,7 +529,11 @@ class PriceDataCollector:
         use_cache: bool = True
     ) -> Optional[List[Dict]]:
         """
-        Fetch OHLCV data with failover and caching.
+        Fetch OHLCV data with hedged failover and caching.
+        
+        Cached candles past their TTL are served immediately while a
+        background task refreshes them (stale-while-revalidate); only a
+        cache miss waits for the sources.
         
         Args:
             coin: Coin symbol (e.g., "BTC")
@@ -344,26 +551,26 @@ class PriceDataCollector:
         
         # Check cache first
         if use_cache:
-            cached = cache.get_ohlcv(coin, timeframe)
-            if cached:
-                logger.info(f"Using cached OHLCV for {coin} {timeframe}")
+            entry = cache.get_ohlcv_entry(coin, timeframe)
+            if entry and entry[0]:
+                cached, fresh = entry
+                if fresh:
+                    logger.info(f"Using cached OHLCV for {coin} {timeframe}")
+                else:
+                    logger.info(f"Serving stale OHLCV for {coin} {timeframe} while refreshing")
+                    self._schedule_ohlcv_refresh(coin, timeframe, limit)
                 return cached
         
-        # Try Binance first
-        candles = await self._retry_request(self._fetch_binance_ohlcv, coin, timeframe, limit)
-        
-        # Failover to CoinGecko if Binance failed
-        if candles is None:
-            logger.warning(f"Binance unavailable, trying CoinGecko for {coin} OHLCV")
-            candles = await self._retry_request(self._fetch_coingecko_ohlcv, coin, timeframe, limit)
+        # Race Binance against a hedged CoinGecko request
+        candles = await self._race_sources(coin, timeframe, limit)
         
         # If both failed, try to use stale cache data
         if candles is None:
             logger.error(f"All OHLCV sources failed for {coin}")
-            cached = cache.get_ohlcv(coin, timeframe)
-            if cached:
+            entry = cache.get_ohlcv_entry(coin, timeframe)
+            if entry and entry[0]:
                 logger.warning(f"Using stale cached OHLCV for {coin} {timeframe}")
-                return cached
+                return entry[0]
             raise APIUnavailableError(f"Unable to fetch OHLCV for {coin} from any source")
         
         # Cache the result
@@ -372,7 +579,7 @@ class PriceDataCollector:
 
 
 
-class SocialMediaCollector:
+class SocialMediaCollector(RetryMixin):
     """Collects social media data from Twitter, Reddit, and Telegram."""
     
     def __init__(self):
@@ -380,23 +587,7 @@ class SocialMediaCollector:
         self.max_retries = 3
         self.retry_delay = 1
         self.timeout = 10
-    
-    async def _retry_request(self, func, *args, **kwargs) -> Optional[Any]:
-        """Execute request with exponential backoff retry."""
-        for attempt in range(self.max_retries):
-            try:
-                return await func(*args, **kwargs)
-            except Exception as e:
-                if attempt < self.max_retries - 1:
-                    delay = self.retry_delay * (2 ** attempt)
-                    logger.warning(
-                        f"Request failed (attempt {attempt + 1}/{self.max_retries}): {e}. "
-                        f"Retrying in {delay}s..."
-                    )
-                    await asyncio.sleep(delay)
-                else:
-                    logger.error(f"Request failed after {self.max_retries} attempts: {e}")
-                    return None
+        self._failure_counts: Dict[str, int] = {}
     
     async def _fetch_twitter_data(self, coin: str, limit: int = 100) -> Optional[List[Dict]]:
         """
@@ -541,7 +732,14 @@ class SocialMediaCollector:
         if platforms is None:
             platforms = ["twitter", "reddit", "telegram"]
         
+        fetchers = {
+            "twitter": self._fetch_twitter_data,
+            "reddit": self._fetch_reddit_data,
+            "telegram": self._fetch_telegram_data
+        }
+        
         results = {}
+        to_fetch = []
         
         for platform in platforms:
             # Check cache first
@@ -551,15 +749,21 @@ class SocialMediaCollector:
                     logger.info(f"Using cached {platform} data for {coin}")
                     results[platform] = cached
                     continue
-            
-            # Fetch data based on platform
-            data = None
-            if platform == "twitter":
-                data = await self._retry_request(self._fetch_twitter_data, coin, limit)
-            elif platform == "reddit":
-                data = await self._retry_request(self._fetch_reddit_data, coin, limit)
-            elif platform == "telegram":
-                data = await self._retry_request(self._fetch_telegram_data, coin, limit)
+            results[platform] = []  # placeholder keeps the requested order
+            to_fetch.append(platform)
+        
+        # Fetch all uncached platforms concurrently
+        known = [platform for platform in to_fetch if platform in fetchers]
+        fetched = dict(zip(known, await asyncio.gather(
+            *[self._retry_request(fetchers[platform], coin, limit) for platform in known],
+            return_exceptions=True
+        )))
+        
+        for platform in to_fetch:
+            data = fetched.get(platform)
+            if isinstance(data, Exception):
+                logger.error(f"Error fetching {platform} data for {coin}: {data}")
+                data = None
             
             # Handle failures gracefully
             if data is None:
@@ -582,7 +786,7 @@ class SocialMediaCollector:
 
 
 
-class NewsCollector:
+class NewsCollector(RetryMixin):
     """Collects news data from CoinDesk, CoinTelegraph, and other sources."""
     
     def __init__(self):
@@ -592,23 +796,7 @@ class NewsCollector:
         self.max_retries = 3
         self.retry_delay = 1
         self.timeout = 10
-    
-    async def _retry_request(self, func, *args, **kwargs) -> Optional[Any]:
-        """Execute request with exponential backoff retry."""
-        for attempt in range(self.max_retries):
-            try:
-                return await func(*args, **kwargs)
-            except Exception as e:
-                if attempt < self.max_retries - 1:
-                    delay = self.retry_delay * (2 ** attempt)
-                    logger.warning(
-                        f"Request failed (attempt {attempt + 1}/{self.max_retries}): {e}. "
-                        f"Retrying in {delay}s..."
-                    )
-                    await asyncio.sleep(delay)
-                else:
-                    logger.error(f"Request failed after {self.max_retries} attempts: {e}")
-                    return None
+        self._failure_counts: Dict[str, int] = {}
     
     async def _parse_rss_feed(self, url: str, coin: str) -> Optional[List[Dict]]:
         """
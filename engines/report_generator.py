@@ -3,9 +3,11 @@ Report Generator Engine
 Generates HTML and PDF reports for analysis results.
 Supports: AnalysisResult, BacktestResult, Portfolio reports
 """
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple, TextIO
 from datetime import datetime
+from functools import lru_cache
 from io import BytesIO
+import asyncio
 import base64
 
 # HTML generation
@@ -32,6 +34,17 @@ from models.schemas import (
 )
 
 
+@lru_cache(maxsize=None)
+def _compile_template(source: str) -> Template:
+    """
+    Compile a Jinja2 template source once per process.
+    
+    The report templates are constant strings, so every ReportGenerator
+    instance (and every call) reuses the same compiled Template.
+    """
+    return Template(source)
+
+
 class ReportGenerator:
     """
     Generates comprehensive reports for analysis results.
@@ -51,17 +64,19 @@ class ReportGenerator:
     def generate_html_report(
         self,
         analysis: AnalysisResult,
-        chart_images: Optional[Dict[str, str]] = None
-    ) -> str:
+        chart_images: Optional[Dict[str, str]] = None,
+        out: Optional[TextIO] = None
+    ) -> Optional[str]:
         """
         Generate HTML report for analysis result.
         
         Args:
             analysis: Complete analysis result
             chart_images: Optional dict of chart names to base64 encoded images
+            out: Optional text stream to write the HTML to instead of returning it
         
         Returns:
-            HTML string
+            HTML string, or None when written to out
         """
         # Prepare data for template
         context = {
@@ -81,26 +96,24 @@ class ReportGenerator:
             'generated_at': datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')
         }
         
-        # Render template
-        template = Template(self.html_template)
-        html = template.render(**context)
-        
-        return html
+        return self._render_template(self.html_template, context, out)
     
     def generate_backtest_html_report(
         self,
         backtest: BacktestResult,
-        chart_images: Optional[Dict[str, str]] = None
-    ) -> str:
+        chart_images: Optional[Dict[str, str]] = None,
+        out: Optional[TextIO] = None
+    ) -> Optional[str]:
         """
         Generate HTML report for backtest result.
         
         Args:
             backtest: Complete backtest result
             chart_images: Optional dict of chart names to base64 encoded images
+            out: Optional text stream to write the HTML to instead of returning it
         
         Returns:
-            HTML string
+            HTML string, or None when written to out
         """
         context = {
             'backtest': backtest,
@@ -115,25 +128,24 @@ class ReportGenerator:
             'generated_at': datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')
         }
         
-        template = Template(self.backtest_html_template)
-        html = template.render(**context)
-        
-        return html
+        return self._render_template(self.backtest_html_template, context, out)
     
     def generate_portfolio_html_report(
         self,
         portfolio: Portfolio,
-        chart_images: Optional[Dict[str, str]] = None
-    ) -> str:
+        chart_images: Optional[Dict[str, str]] = None,
+        out: Optional[TextIO] = None
+    ) -> Optional[str]:
         """
         Generate HTML report for portfolio.
         
         Args:
             portfolio: Portfolio data
             chart_images: Optional dict of chart names to base64 encoded images
+            out: Optional text stream to write the HTML to instead of returning it
         
         Returns:
-            HTML string
+            HTML string, or None when written to out
         """
         context = {
             'portfolio': portfolio,
@@ -146,10 +158,7 @@ class ReportGenerator:
             'generated_at': datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')
         }
         
-        template = Template(self.portfolio_html_template)
-        html = template.render(**context)
-        
-        return html
+        return self._render_template(self.portfolio_html_template, context, out)
     
     # ========================================================================
     # PDF Report Generation (WeasyPrint)
@@ -234,10 +243,140 @@ class ReportGenerator:
         else:
             return self._generate_portfolio_pdf_with_reportlab(portfolio, chart_images)
     
+    def generate_backtest_pdf_report_fast(self, backtest: BacktestResult) -> bytes:
+        """
+        Generate backtest PDF directly with ReportLab tables.
+        
+        Skips HTML rendering and WeasyPrint's CSS layout even when WeasyPrint
+        is installed; the output has no embedded charts.
+        
+        Args:
+            backtest: Complete backtest result
+        
+        Returns:
+            PDF bytes
+        """
+        return self._generate_backtest_pdf_with_reportlab(backtest)
+    
+    def generate_portfolio_pdf_report_fast(self, portfolio: Portfolio) -> bytes:
+        """
+        Generate portfolio PDF directly with ReportLab tables.
+        
+        Skips HTML rendering and WeasyPrint's CSS layout even when WeasyPrint
+        is installed; the output has no embedded charts.
+        
+        Args:
+            portfolio: Portfolio data
+        
+        Returns:
+            PDF bytes
+        """
+        return self._generate_portfolio_pdf_with_reportlab(portfolio)
+    
+    # ========================================================================
+    # Async Report Generation
+    # ========================================================================
+    
+    async def agenerate_html_report(
+        self,
+        analysis: AnalysisResult,
+        chart_images: Optional[Dict[str, str]] = None
+    ) -> str:
+        """Generate the analysis HTML report in a worker thread."""
+        return await asyncio.to_thread(self.generate_html_report, analysis, chart_images)
+    
+    async def agenerate_backtest_html_report(
+        self,
+        backtest: BacktestResult,
+        chart_images: Optional[Dict[str, str]] = None
+    ) -> str:
+        """Generate the backtest HTML report in a worker thread."""
+        return await asyncio.to_thread(self.generate_backtest_html_report, backtest, chart_images)
+    
+    async def agenerate_portfolio_html_report(
+        self,
+        portfolio: Portfolio,
+        chart_images: Optional[Dict[str, str]] = None
+    ) -> str:
+        """Generate the portfolio HTML report in a worker thread."""
+        return await asyncio.to_thread(self.generate_portfolio_html_report, portfolio, chart_images)
+    
+    async def agenerate_pdf_report(
+        self,
+        analysis: AnalysisResult,
+        chart_images: Optional[Dict[str, str]] = None
+    ) -> bytes:
+        """Generate the analysis PDF report in a worker thread."""
+        return await asyncio.to_thread(self.generate_pdf_report, analysis, chart_images)
+    
+    async def agenerate_backtest_pdf_report(
+        self,
+        backtest: BacktestResult,
+        chart_images: Optional[Dict[str, str]] = None
+    ) -> bytes:
+        """Generate the backtest PDF report in a worker thread."""
+        return await asyncio.to_thread(self.generate_backtest_pdf_report, backtest, chart_images)
+    
+    async def agenerate_portfolio_pdf_report(
+        self,
+        portfolio: Portfolio,
+        chart_images: Optional[Dict[str, str]] = None
+    ) -> bytes:
+        """Generate the portfolio PDF report in a worker thread."""
+        return await asyncio.to_thread(self.generate_portfolio_pdf_report, portfolio, chart_images)
+    
+    async def generate_bundle(
+        self,
+        analysis: AnalysisResult,
+        backtest: BacktestResult,
+        portfolio: Portfolio
+    ) -> Tuple[bytes, bytes, bytes]:
+        """
+        Generate the analysis, backtest and portfolio PDF reports off the event loop.
+        
+        Each render runs in a worker thread so the loop keeps serving other
+        requests meanwhile. The renderers are CPU-bound and hold the GIL, so
+        the threads mostly take turns: the bundle takes about as long as the
+        three renders back to back.
+        
+        Args:
+            analysis: Complete analysis result
+            backtest: Complete backtest result
+            portfolio: Portfolio data
+        
+        Returns:
+            Tuple of (analysis PDF, backtest PDF, portfolio PDF) bytes
+        """
+        analysis_pdf, backtest_pdf, portfolio_pdf = await asyncio.gather(
+            self.agenerate_pdf_report(analysis),
+            self.agenerate_backtest_pdf_report(backtest),
+            self.agenerate_portfolio_pdf_report(portfolio)
+        )
+        return analysis_pdf, backtest_pdf, portfolio_pdf
+    
     # ========================================================================
     # Helper Methods
     # ========================================================================
     
+    def _render_template(
+        self,
+        source: str,
+        context: Dict[str, Any],
+        out: Optional[TextIO] = None
+    ) -> Optional[str]:
+        """
+        Render a report template to a string, or stream it into out.
+        
+        Streaming writes the template's chunks as they are produced, so large
+        reports never exist as one string when the caller only needs a file.
+        """
+        template = _compile_template(source)
+        if out is None:
+            return template.render(**context)
+        
+        template.stream(**context).dump(out)
+        return None
+    
     def _get_signal_color(self, signal_type: SignalType) -> str:
         """Get color for signal type."""
         colors = {
@@ -5,7 +5,7 @@ Performs all necessary checks and initializations before starting the applicatio
 """
 import sys
 import time
-from utils.dependencies import startup_checks, check_database_connection, check_redis_connection
+from utils.dependencies import startup_checks, check_services
 from utils.logger import setup_logger
 from migrate import run_migrations, check_migration_status
 
@@ -28,8 +28,7 @@ def wait_for_services(max_retries=30, retry_interval=2):
     for attempt in range(1, max_retries + 1):
         logger.info(f"Service check attempt {attempt}/{max_retries}")
         
-        db_ok = check_database_connection()
-        redis_ok = check_redis_connection()
+        db_ok, redis_ok = check_services()
         
         if db_ok and redis_ok:
             logger.info("All services are available.")
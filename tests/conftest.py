@@ -0,0 +1,246 @@
+"""
+Shared pytest fixtures.
+"""
+import fnmatch
+import os
+from datetime import datetime
+
+import pytest
+from hypothesis import Phase, settings
+from pytest_asyncio import is_async_test
+
+from models.schemas import BacktestParameters, BacktestTrade, Signal, SignalType
+
+
+# Persist Numba's compiled kernels in a stable, cacheable location so JIT
+# compilation happens once per Numba version rather than once per run.
+# Must be set before numba is first imported.
+os.environ.setdefault(
+    "NUMBA_CACHE_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".numba_cache")
+)
+
+
+# Hypothesis profiles. "ci" skips shrinking (a failure is reproduced locally
+# from the printed seed) and caps the example count; select it with
+# HYPOTHESIS_PROFILE=ci.
+settings.register_profile(
+    "ci",
+    phases=[Phase.explicit, Phase.reuse, Phase.generate],
+    max_examples=25
+)
+settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", "default"))
+
+
+# ============================================================================
+# Async Fixtures
+# ============================================================================
+
+def pytest_collection_modifyitems(items):
+    """
+    Run every async test on one event loop for the whole session.
+    
+    pytest-asyncio would otherwise create and close a loop per test, which
+    async Hypothesis tests pay once per example. Marking the tests with a
+    session loop scope is the supported replacement for overriding the
+    event_loop fixture.
+    """
+    session_scope_marker = pytest.mark.asyncio(scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_scope_marker, append=False)
+
+
+# Fixed reference time for backtesting fixtures (matches NOW in the backtesting tests)
+BACKTEST_NOW = datetime(2024, 1, 1, 0, 0, 0)
+
+
+# ============================================================================
+# Backtesting Fixtures
+# ============================================================================
+
+@pytest.fixture(scope="session")
+def backtesting_engine():
+    """
+    Create a backtesting engine instance shared by all tests.
+    
+    Runs the drawdown kernel once so any JIT compilation happens here
+    rather than inside a Hypothesis example.
+    """
+    from engines.backtesting import BacktestingEngine
+    
+    engine = BacktestingEngine()
+    engine._calculate_max_drawdown([(BACKTEST_NOW, 10000.0), (BACKTEST_NOW, 10500.0)])
+    return engine
+
+
+@pytest.fixture(scope="session")
+def sample_parameters():
+    """Create sample backtesting parameters (read-only, shared)."""
+    return BacktestParameters(
+        indicators=["RSI", "MACD", "Bollinger Bands"],
+        indicator_thresholds={"RSI": 30, "MACD": 0},
+        use_fundamental=False,
+        signal_threshold=60.0
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_signal():
+    """Create a sample signal (read-only, shared)."""
+    return Signal(
+        signal_type=SignalType.BUY,
+        success_probability=65.0,
+        timestamp=BACKTEST_NOW,
+        coin="BTC",
+        timeframe="1h",
+        stop_loss=48000.0,
+        take_profit=53000.0,
+        ema_200_filter_applied=False,
+        golden_death_cross_detected=None,
+        rsi_divergence_detected=None
+    )
+
+
+@pytest.fixture(scope="session")
+def trade_template(sample_signal):
+    """Validated BacktestTrade to derive test trades from via model_copy."""
+    return BacktestTrade(
+        entry_date=BACKTEST_NOW,
+        entry_price=50000.0,
+        exit_date=BACKTEST_NOW,
+        exit_price=50000.0,
+        profit_loss=0.0,
+        profit_loss_percent=0.0,
+        signal_at_entry=sample_signal
+    )
+
+
+# ============================================================================
+# Cache Fixtures
+# ============================================================================
+
+class FakeRedisClient:
+    """
+    Dict-backed stand-in for the redis client used by RedisCache.
+    
+    Covers the commands RedisCache issues; TTLs are recorded but keys never
+    expire.
+    """
+    
+    def __init__(self):
+        self.store = {}
+        self.ttls = {}
+    
+    def ping(self):
+        return True
+    
+    def get(self, key):
+        return self.store.get(key)
+    
+    def mget(self, keys):
+        return [self.store.get(key) for key in keys]
+    
+    def set(self, key, value, ex=None):
+        self.store[key] = value
+        if ex:
+            self.ttls[key] = ex
+        else:
+            self.ttls.pop(key, None)
+        return True
+    
+    def mset(self, mapping):
+        for key, value in mapping.items():
+            self.set(key, value)
+        return True
+    
+    def setex(self, key, ttl, value):
+        self.store[key] = value
+        self.ttls[key] = ttl
+        return True
+    
+    def delete(self, *keys):
+        deleted = 0
+        for key in keys:
+            if self.store.pop(key, None) is not None:
+                self.ttls.pop(key, None)
+                deleted += 1
+        return deleted
+    
+    def exists(self, key):
+        return int(key in self.store)
+    
+    def keys(self, pattern="*"):
+        return [key for key in self.store if fnmatch.fnmatchcase(key, pattern)]
+    
+    def expire(self, key, ttl):
+        if key not in self.store:
+            return False
+        self.ttls[key] = ttl
+        return True
+    
+    def ttl(self, key):
+        if key not in self.store:
+            return -2
+        return self.ttls.get(key, -1)
+    
+    def flushdb(self):
+        self.store.clear()
+        self.ttls.clear()
+        return True
+    
+    def pipeline(self, transaction=True):
+        return FakeRedisPipeline(self)
+
+
+class FakeRedisPipeline:
+    """Buffers FakeRedisClient commands until execute(), like a redis pipeline."""
+    
+    def __init__(self, client):
+        self.client = client
+        self.commands = []
+    
+    def set(self, key, value, ex=None):
+        self.commands.append((self.client.set, (key, value), {"ex": ex}))
+        return self
+    
+    def mset(self, mapping):
+        self.commands.append((self.client.mset, (dict(mapping),), {}))
+        return self
+    
+    def execute(self):
+        results = [command(*args, **kwargs) for command, args, kwargs in self.commands]
+        self.commands = []
+        return results
+
+
+@pytest.fixture(scope="module")
+def fake_cache():
+    """
+    Back the global cache with FakeRedisClient for a module's tests.
+    
+    The client of the shared RedisCache instance is swapped rather than the
+    instance itself, so modules that did `from utils.cache import cache` at
+    import time see the fake too. Yields the cache instance.
+    """
+    from utils.cache import cache
+    
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(cache, "client", FakeRedisClient())
+        yield cache
+
+
+@pytest.fixture(scope="session")
+def redis_cache():
+    """
+    Warm up the global cache's real Redis connection once for the session.
+    
+    Integration tests request this so the connection handshake happens here,
+    not inside the first timed cache call; skips them if Redis is down. The
+    redis client keeps its own connection pool, reused by every test.
+    """
+    from utils.cache import cache
+    
+    if not cache.ping():
+        pytest.skip("Redis is not available")
+    return cache
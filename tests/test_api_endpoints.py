@@ -3,9 +3,13 @@ Property-based tests for API endpoints.
 Tests coin validation and timeframe processing.
 """
 import pytest
+from datetime import datetime, timedelta
+from urllib.parse import quote
 from hypothesis import given, strategies as st, settings, HealthCheck
 from fastapi.testclient import TestClient
 from api.main import app
+from api.routes import coins as coins_route
+from api.validation import is_coin_shape_valid
 from engines.data_collector import DataCollector
 
 # Create test client
@@ -29,7 +33,7 @@ VALID_TIMEFRAMES = ['15m', '1h', '4h', '8h', '12h', '24h', '1w', '15d', '1M']
     coin=st.sampled_from(SUPPORTED_COINS)
 )
 @settings(
-    max_examples=100,
+    max_examples=len(SUPPORTED_COINS),
     deadline=None,
     suppress_health_check=[HealthCheck.function_scoped_fixture]
 )
@@ -50,6 +54,77 @@ def test_property_1_valid_coin_accepted(coin):
         f"Valid coin {coin} was rejected with 400 error"
 
 
+def test_valid_coins_accepted_batch(monkeypatch):
+    """All supported coins are accepted in a single batched price request."""
+    start = datetime(2024, 1, 1)
+    
+    async def fake_fetch_ohlcv(coin, timeframe, limit=100, use_cache=True):
+        # 24 hourly candles with close rising from 100 to 123
+        return [
+            {
+                "timestamp": start + timedelta(hours=i),
+                "open": 100.0 + i,
+                "high": 101.0 + i,
+                "low": 99.0 + i,
+                "close": 100.0 + i,
+                "volume": 1000.0
+            }
+            for i in range(24)
+        ]
+    
+    monkeypatch.setattr(coins_route.data_collector, "fetch_ohlcv", fake_fetch_ohlcv)
+    
+    response = client.get("/api/coins/prices", params={"coins": ",".join(SUPPORTED_COINS)})
+    
+    assert response.status_code == 200, response.text
+    data = response.json()
+    assert set(data) == set(SUPPORTED_COINS)
+    
+    for symbol, price_info in data.items():
+        assert price_info["symbol"] == symbol
+        assert price_info["price"] == 123.0
+        assert price_info["timestamp"] == (start + timedelta(hours=23)).isoformat()
+        assert price_info["24h_change"] == pytest.approx(23.0)
+        assert price_info["volume"] == 1000.0
+
+
+def test_batch_prices_rejects_unsupported_coin():
+    """Batched price request rejects unsupported coins with 400."""
+    response = client.get("/api/coins/prices", params={"coins": "BTC,NOTACOIN"})
+    assert response.status_code == 400
+    data = response.json()
+    assert "error_code" in data or "detail" in data
+
+
+@given(
+    coin=st.from_regex(r"[A-Z0-9]{1,10}", fullmatch=True).filter(
+        lambda x: x not in coins_route.SUPPORTED_COINS_SET
+    )
+)
+@settings(
+    max_examples=100,
+    deadline=None,
+    suppress_health_check=[HealthCheck.function_scoped_fixture]
+)
+def test_property_1_invalid_coin_rejected(coin):
+    """
+    Property 1: Coin Validation - Invalid Coins
+    
+    For any invalid coin, the system SHALL reject it with a descriptive error message.
+    Ticker-shaped symbols pass the format pre-check and are rejected by the
+    supported-coin lookup.
+    
+    **Validates: Requirements 1.1, 1.2**
+    """
+    response = client.get(f"/api/coins/{coin}/price")
+    
+    assert response.status_code == 400, \
+        f"Invalid coin {coin} was not properly rejected (status: {response.status_code})"
+    data = response.json()
+    assert "error_code" in data or "detail" in data, \
+        "Error response should contain error_code or detail"
+
+
 @given(
     coin=st.text(
         alphabet=st.characters(
@@ -59,38 +134,41 @@ def test_property_1_valid_coin_accepted(coin):
         ),
         min_size=1,
         max_size=20
-    ).filter(lambda x: x.upper().strip() not in SUPPORTED_COINS and x.strip() != "")
+    ).filter(lambda x: not is_coin_shape_valid(x) and x.strip(".") != "")
 )
 @settings(
     max_examples=100,
     deadline=None,
     suppress_health_check=[HealthCheck.function_scoped_fixture]
 )
-def test_property_1_invalid_coin_rejected(coin):
+def test_property_1_malformed_coin_rejected(coin):
     """
-    Property 1: Coin Validation - Invalid Coins
+    Property 1: Coin Validation - Malformed Coins
     
-    For any invalid coin, the system SHALL reject it with a descriptive error message.
+    For any symbol that is not ticker-shaped, the system SHALL reject it
+    with a descriptive error message before any lookup.
     
     **Validates: Requirements 1.1, 1.2**
     """
-    # Make request with invalid coin
-    try:
-        response = client.get(f"/api/coins/{coin}/price")
-        
-        # Invalid coins should be rejected with 400 or 404
-        assert response.status_code in [400, 404, 500], \
-            f"Invalid coin {coin} was not properly rejected (status: {response.status_code})"
-        
-        # Should have error message
-        if response.status_code in [400, 404]:
-            data = response.json()
-            assert "error_code" in data or "detail" in data, \
-                "Error response should contain error_code or detail"
-    except Exception as e:
-        # If URL encoding fails, that's also a valid rejection
-        assert "Invalid" in str(e) or "URL" in str(e), \
-            f"Unexpected error for invalid coin {coin}: {e}"
+    # Percent-encode so '?', '#', '%' and friends stay inside the path
+    # segment ('.'/'..' segments are filtered out above)
+    response = client.get(f"/api/coins/{quote(coin, safe='')}/price")
+    
+    assert response.status_code == 400, \
+        f"Malformed coin {coin!r} was not properly rejected (status: {response.status_code})"
+    data = response.json()
+    assert "error_code" in data or "detail" in data, \
+        "Error response should contain error_code or detail"
+
+
+def test_malformed_coin_rejected():
+    """Malformed coin symbols are rejected by the format pre-check."""
+    assert not is_coin_shape_valid("B$C!")
+    
+    response = client.get("/api/coins/B$C!/price")
+    assert response.status_code == 400
+    data = response.json()
+    assert "error_code" in data or "detail" in data
 
 
 # ============================================================================
@@ -0,0 +1,239 @@
+"""
+Property-based tests for Backtesting Engine.
+Tests backtesting initialization and metrics calculation.
+Shared fixtures live in conftest.py.
+"""
+import os
+import re
+from functools import lru_cache
+import numpy as np
+import pytest
+from hypothesis import given, strategies as st, settings
+from datetime import datetime, timedelta
+
+
+# Examples per property on the default run; the full 100-example sweeps are
+# marked slow and run separately (pytest -m slow)
+HYP_MAX_EXAMPLES = int(os.environ.get('HYP_MAX_EXAMPLES', 25))
+HYP_FULL_EXAMPLES = 100
+
+# Fixed reference time so generated dates are deterministic across examples
+NOW = datetime(2024, 1, 1, 0, 0, 0)
+ZERO_DURATION = timedelta(0)
+
+# Canonical lowercase UUID string as produced by str(uuid.uuid4())
+UUID_PATTERN = re.compile(
+    r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$', re.I
+)
+
+
+@lru_cache(maxsize=64)
+def _trade_template(num_trades):
+    """
+    Capital-independent trade pattern shared by property 55 examples.
+    
+    Returns:
+        Tuple of (entry_dates, exit_dates, entry_price, exit_prices,
+        profit_loss_percents) where profit_loss_percents is a NumPy array
+    """
+    current_date = NOW - timedelta(days=30)
+    entry_price = 50000.0
+    
+    entry_dates = tuple(current_date + timedelta(hours=i * 24) for i in range(num_trades))
+    exit_dates = tuple(entry_date + timedelta(hours=12) for entry_date in entry_dates)
+    # Some trades win, some lose: every third trade is a 2% profit, the rest 2% losses
+    is_win = np.tile([True, False, False], (num_trades + 2) // 3)[:num_trades]
+    exit_price_array = np.where(is_win, entry_price * 1.02, entry_price * 0.98)
+    profit_loss_percents = ((exit_price_array - entry_price) / entry_price) * 100
+    profit_loss_percents.setflags(write=False)
+    
+    return (
+        entry_dates, exit_dates, entry_price,
+        tuple(exit_price_array.tolist()), profit_loss_percents
+    )
+
+
+# ============================================================================
+# Property-Based Tests
+# ============================================================================
+
+PROPERTY_51_STRATEGIES = dict(
+    coin=st.sampled_from(["BTC", "ETH", "BNB", "ADA", "SOL"]),
+    timeframe=st.sampled_from(["1h", "4h", "24h"])
+)
+
+PROPERTY_55_STRATEGIES = dict(
+    initial_capital=st.floats(min_value=1000, max_value=100000),
+    num_trades=st.integers(min_value=0, max_value=50)
+)
+
+
+async def _check_property_51(backtesting_engine, sample_parameters, coin, timeframe):
+    """Property 51 body shared by the default and full-sweep tests."""
+    # Create valid date range based on timeframe
+    # For 24h timeframe, need at least 50 days for 50 candles
+    # For 4h timeframe, need at least 10 days for 60 candles
+    # For 1h timeframe, need at least 3 days for 72 candles
+    end_date = NOW
+    
+    if timeframe == "24h":
+        days = 60  # 60 candles
+    elif timeframe == "4h":
+        days = 15  # 90 candles
+    else:  # 1h
+        days = 5  # 120 candles
+    
+    start_date = end_date - timedelta(days=days)
+    initial_capital = 10000.0
+    
+    # Start backtest
+    backtest_id = await backtesting_engine.start_backtest(
+        coin=coin,
+        timeframe=timeframe,
+        start_date=start_date,
+        end_date=end_date,
+        initial_capital=initial_capital,
+        parameters=sample_parameters
+    )
+    
+    # Verify backtest ID is generated
+    assert backtest_id is not None
+    assert isinstance(backtest_id, str)
+    assert len(backtest_id) > 0
+    
+    # Verify it's a valid UUID format
+    assert UUID_PATTERN.match(backtest_id) is not None, \
+        f"Backtest ID should be a valid UUID, got: {backtest_id}"
+
+
+def _check_property_55(backtesting_engine, trade_template, initial_capital, num_trades):
+    """Property 55 body shared by the default and full-sweep tests."""
+    # Generate sample trades from the cached capital-independent pattern
+    entry_dates, exit_dates, entry_price, exit_prices, profit_loss_percents = \
+        _trade_template(num_trades)
+    profit_losses = initial_capital * profit_loss_percents / 100
+    
+    trades = [
+        trade_template.model_copy(update={
+            'entry_date': entry_dates[i],
+            'entry_price': entry_price,
+            'exit_date': exit_dates[i],
+            'exit_price': exit_prices[i],
+            'profit_loss': float(profit_losses[i]),
+            'profit_loss_percent': float(profit_loss_percents[i])
+        })
+        for i in range(num_trades)
+    ]
+    
+    # Generate equity curve (cumulative P/L after each trade exit)
+    equity = initial_capital + np.cumsum(profit_losses)
+    equity_curve = list(zip(exit_dates, equity.tolist()))
+    
+    # Calculate metrics
+    metrics = backtesting_engine.calculate_metrics(
+        trades, initial_capital, equity_curve
+    )
+    
+    # Verify all required metrics are present and valid
+    assert metrics is not None
+    
+    # Total trades
+    assert metrics.total_trades == num_trades
+    assert metrics.total_trades >= 0
+    
+    # Winning and losing trades
+    assert metrics.winning_trades >= 0
+    assert metrics.losing_trades >= 0
+    assert metrics.winning_trades + metrics.losing_trades == num_trades
+    
+    # Win rate
+    assert 0.0 <= metrics.win_rate <= 100.0
+    if num_trades > 0:
+        expected_win_rate = (metrics.winning_trades / num_trades) * 100
+        assert abs(metrics.win_rate - expected_win_rate) < 0.01
+    
+    # Total profit/loss, Sharpe ratio and profit factor are floats
+    assert all(isinstance(value, float) for value in (
+        metrics.total_profit_loss,
+        metrics.total_profit_loss_percent,
+        metrics.sharpe_ratio,
+        metrics.profit_factor
+    ))
+    
+    # Max drawdown
+    assert metrics.max_drawdown >= 0.0
+    assert metrics.max_drawdown_percent >= 0.0
+    
+    # Average trade duration
+    assert isinstance(metrics.average_trade_duration, timedelta)
+    if num_trades > 0:
+        assert metrics.average_trade_duration >= ZERO_DURATION
+    
+    # Profit factor
+    assert metrics.profit_factor >= 0.0
+
+
+@pytest.mark.asyncio
+@given(**PROPERTY_51_STRATEGIES)
+@settings(max_examples=HYP_MAX_EXAMPLES, deadline=None)
+async def test_property_51_backtesting_initialization(
+    backtesting_engine,
+    sample_parameters,
+    coin,
+    timeframe
+):
+    """
+    Feature: crypto-analysis-system, Property 51: Backtesting Başlatma
+    
+    Herhangi bir geçerli coin ve zaman aralığı için, backtesting başlatılabilmelidir.
+    
+    **Validates: Gereksinim 19.1**
+    """
+    await _check_property_51(backtesting_engine, sample_parameters, coin, timeframe)
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+@given(**PROPERTY_51_STRATEGIES)
+@settings(max_examples=HYP_FULL_EXAMPLES, deadline=None)
+async def test_property_51_backtesting_initialization_full(
+    backtesting_engine,
+    sample_parameters,
+    coin,
+    timeframe
+):
+    """Property 51 with the full 100-example sweep."""
+    await _check_property_51(backtesting_engine, sample_parameters, coin, timeframe)
+
+
+@given(**PROPERTY_55_STRATEGIES)
+@settings(max_examples=HYP_MAX_EXAMPLES, deadline=None)
+def test_property_55_backtesting_metrics_integrity(
+    backtesting_engine,
+    trade_template,
+    initial_capital,
+    num_trades
+):
+    """
+    Feature: crypto-analysis-system, Property 55: Backtesting Metrik Bütünlüğü
+    
+    Herhangi bir tamamlanan backtesting için, tüm gerekli metrikler hesaplanmalıdır:
+    toplam kar/zarar yüzdesi, kazanan/kaybeden işlem sayısı, başarı oranı,
+    maksimum düşüş, ortalama işlem süresi.
+    
+    **Validates: Gereksinim 19.6**
+    """
+    _check_property_55(backtesting_engine, trade_template, initial_capital, num_trades)
+
+
+@pytest.mark.slow
+@given(**PROPERTY_55_STRATEGIES)
+@settings(max_examples=HYP_FULL_EXAMPLES, deadline=None)
+def test_property_55_backtesting_metrics_integrity_full(
+    backtesting_engine,
+    trade_template,
+    initial_capital,
+    num_trades
+):
+    """Property 55 with the full 100-example sweep."""
+    _check_property_55(backtesting_engine, trade_template, initial_capital, num_trades)
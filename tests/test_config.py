@@ -5,7 +5,18 @@ Includes property-based tests for configuration validation.
 import os
 import pytest
 from hypothesis import given, strategies as st, assume, settings, HealthCheck
-from utils.config import Settings
+from utils.config import Settings, get_settings
+
+
+@pytest.fixture(autouse=True)
+def reset_settings_cache(request):
+    """Drop the cached Settings around tests that modify the environment."""
+    if "monkeypatch" not in request.fixturenames:
+        yield
+        return
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
 
 
 class TestConfigBasic:
@@ -13,7 +24,7 @@ class TestConfigBasic:
     
     def test_settings_initialization(self):
         """Test that settings can be initialized."""
-        settings = Settings()
+        settings = get_settings()
         assert settings is not None
         assert hasattr(settings, 'APP_NAME')
         assert hasattr(settings, 'DATABASE_URL')
@@ -21,12 +32,23 @@ class TestConfigBasic:
     
     def test_default_values(self):
         """Test default configuration values."""
-        settings = Settings()
+        settings = get_settings()
         assert settings.APP_NAME == "Kripto Para Analiz Sistemi"
         assert settings.APP_VERSION == "1.0.0"
         assert settings.PORT == 8000
         assert settings.ALGORITHM == "HS256"
     
+    def test_get_settings_is_cached(self):
+        """Test that get_settings returns a single shared instance."""
+        assert get_settings() is get_settings()
+    
+    def test_get_settings_reloads_after_cache_clear(self, monkeypatch):
+        """Test that clearing the cache picks up environment changes."""
+        monkeypatch.setenv("APP_NAME", "Reloaded App")
+        get_settings.cache_clear()
+        
+        assert get_settings().APP_NAME == "Reloaded App"
+    
     def test_database_url_construction(self, monkeypatch):
         """Test that DATABASE_URL is constructed correctly."""
         # Clear all database-related environment variables
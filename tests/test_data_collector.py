@@ -4,7 +4,8 @@ Tests error tolerance and data freshness properties.
 """
 import pytest
 import asyncio
-from hypothesis import given, strategies as st, settings, HealthCheck
+import time
+from types import MappingProxyType
 from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, patch, MagicMock
 from engines.data_collector import (
@@ -15,30 +16,179 @@ from engines.data_collector import (
     TrendsCollector,
     APIUnavailableError
 )
+from utils.cache import cache, to_epoch_seconds
+
+
+# Every test in this module runs against the in-memory cache backend
+pytestmark = pytest.mark.usefixtures("fake_cache")
 
 
 # ============================================================================
-# Test Strategies
+# Test Parameters
 # ============================================================================
 
+# The inputs below are small finite sets, so the properties are checked
+# exhaustively with parametrize rather than sampled with Hypothesis.
+
 # Common coin symbols for testing
 SUPPORTED_COINS = ["BTC", "ETH", "BNB", "ADA", "SOL", "XRP", "DOT", "DOGE", "AVAX", "MATIC"]
 TIMEFRAMES = ["15m", "1h", "4h", "8h", "12h", "24h", "1w", "15d", "1M"]
 PLATFORMS = ["twitter", "reddit", "telegram"]
 NEWS_SOURCES = ["coindesk", "cointelegraph"]
 
+# Maximum age of cached data (Gereksinim 5.5)
+FRESHNESS_LIMIT_SECONDS = 24 * 60 * 60
+
+# Read-only payload templates; tests only stamp in a timestamp
+CANDLE_TEMPLATE = MappingProxyType({
+    "open": 50000.0,
+    "high": 51000.0,
+    "low": 49000.0,
+    "close": 50500.0,
+    "volume": 1000000.0
+})
+STALE_CANDLE_TEMPLATE = MappingProxyType({
+    "open": 48000.0,
+    "high": 49000.0,
+    "low": 47000.0,
+    "close": 48500.0,
+    "volume": 900000.0
+})
+POST_TEMPLATE = MappingProxyType({
+    "text": "Test post about crypto",
+    "score": 100,
+    "source": "reddit"
+})
+ARTICLE_TEMPLATE = MappingProxyType({
+    "title": "Crypto news article",
+    "description": "Article about cryptocurrency",
+    "url": "https://example.com/article",
+    "source": "cointelegraph"
+})
+
+
+def _make_candle(timestamp, template=CANDLE_TEMPLATE):
+    """OHLCV candle from a template with the given timestamp."""
+    return {"timestamp": timestamp, **template}
+
+
+def _make_post(created_at, **overrides):
+    """Social media post from POST_TEMPLATE with the given creation time."""
+    return {**POST_TEMPLATE, "created_at": created_at, **overrides}
+
+
+def _make_article(published, **overrides):
+    """News article from ARTICLE_TEMPLATE with the given publish time."""
+    return {**ARTICLE_TEMPLATE, "published": published, **overrides}
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+def _patched_sources(collector, *names):
+    """Patch the named source fetchers once; yield the AsyncMocks in order."""
+    patchers = [patch.object(collector, name, new_callable=AsyncMock) for name in names]
+    mocks = tuple(patcher.start() for patcher in patchers)
+    try:
+        yield mocks
+    finally:
+        for patcher in patchers:
+            patcher.stop()
+
+
+def _reset(collector, *mocks):
+    """
+    Start a fresh scenario on a shared, patched collector.
+    
+    Clears the mocks' calls, return values and side effects, closes the
+    collector's circuit breaker and drops its in-flight SWR refreshes.
+    """
+    for mock in mocks:
+        mock.reset_mock(return_value=True, side_effect=True)
+    
+    collector._failure_counts.clear()
+    refresh_tasks = getattr(collector, "_refresh_tasks", None)
+    if refresh_tasks:
+        for task in refresh_tasks.values():
+            task.cancel()
+        refresh_tasks.clear()
+
+
+@pytest.fixture(scope="module")
+def price_collector():
+    """PriceDataCollector shared by the module's property tests."""
+    return PriceDataCollector()
+
+
+@pytest.fixture(scope="module")
+def social_collector():
+    """SocialMediaCollector shared by the module's property tests."""
+    return SocialMediaCollector()
+
+
+@pytest.fixture(scope="module")
+def news_collector():
+    """NewsCollector shared by the module's property tests."""
+    return NewsCollector()
+
+
+@pytest.fixture(scope="module")
+def _ohlcv_patches(price_collector):
+    yield from _patched_sources(price_collector, '_fetch_binance_ohlcv', '_fetch_coingecko_ohlcv')
+
+
+@pytest.fixture(scope="module")
+def _price_patches(price_collector):
+    yield from _patched_sources(price_collector, '_fetch_binance_price')
+
+
+@pytest.fixture(scope="module")
+def _social_patches(social_collector):
+    yield from _patched_sources(social_collector, '_fetch_twitter_data', '_fetch_reddit_data')
+
+
+@pytest.fixture(scope="module")
+def _news_patches(news_collector):
+    yield from _patched_sources(news_collector, '_fetch_coindesk_news', '_fetch_cointelegraph_news')
+
+
+@pytest.fixture
+def ohlcv_mocks(_ohlcv_patches, price_collector):
+    """(binance, coingecko) OHLCV fetcher mocks, reset before each test."""
+    _reset(price_collector, *_ohlcv_patches)
+    return _ohlcv_patches
+
+
+@pytest.fixture
+def price_mock(_price_patches, price_collector):
+    """Binance price fetcher mock, reset before each test."""
+    _reset(price_collector, *_price_patches)
+    return _price_patches[0]
+
+
+@pytest.fixture
+def social_mocks(_social_patches, social_collector):
+    """(twitter, reddit) fetcher mocks, reset before each test."""
+    _reset(social_collector, *_social_patches)
+    return _social_patches
+
+
+@pytest.fixture
+def news_mocks(_news_patches, news_collector):
+    """(coindesk, cointelegraph) fetcher mocks, reset before each test."""
+    _reset(news_collector, *_news_patches)
+    return _news_patches
+
 
 # ============================================================================
 # Property Test 7: Veri Toplama Hata Toleransı
 # ============================================================================
 
 @pytest.mark.asyncio
-@given(
-    coin=st.sampled_from(SUPPORTED_COINS),
-    timeframe=st.sampled_from(TIMEFRAMES)
-)
-@settings(max_examples=100, suppress_health_check=[HealthCheck.function_scoped_fixture])
-async def test_property_7_data_collection_error_tolerance(coin, timeframe):
+@pytest.mark.parametrize("coin", SUPPORTED_COINS)
+@pytest.mark.parametrize("timeframe", TIMEFRAMES)
+async def test_property_7_data_collection_error_tolerance(coin, timeframe, price_collector, ohlcv_mocks, fake_cache):
     """
     Feature: crypto-analysis-system, Property 7: Veri Toplama Hata Toleransı
     
@@ -47,88 +197,58 @@ async def test_property_7_data_collection_error_tolerance(coin, timeframe):
     
     Validates: Gereksinim 5.4, 6.4, 14.2
     """
-    collector = PriceDataCollector()
+    mock_binance, mock_coingecko = ohlcv_mocks
     
     # Test 1: When primary source (Binance) fails, should try secondary source (CoinGecko)
-    with patch.object(collector, '_fetch_binance_ohlcv', new_callable=AsyncMock) as mock_binance:
-        with patch.object(collector, '_fetch_coingecko_ohlcv', new_callable=AsyncMock) as mock_coingecko:
-            # Simulate Binance failure
-            mock_binance.return_value = None
-            
-            # CoinGecko returns valid data
-            mock_coingecko.return_value = [
-                {
-                    "timestamp": datetime.utcnow(),
-                    "open": 50000.0,
-                    "high": 51000.0,
-                    "low": 49000.0,
-                    "close": 50500.0,
-                    "volume": 1000000.0
-                }
-            ]
-            
-            # Should not raise exception, should return CoinGecko data
-            result = await collector.fetch_ohlcv(coin, timeframe, use_cache=False)
-            
-            # Property: System continues with available data
-            assert result is not None, "System should continue with secondary source when primary fails"
-            assert len(result) > 0, "Should return data from secondary source"
-            assert mock_binance.called, "Should attempt primary source first"
-            assert mock_coingecko.called, "Should failover to secondary source"
+    # Simulate Binance failure
+    mock_binance.return_value = None
+    
+    # CoinGecko returns valid data
+    mock_coingecko.return_value = [_make_candle(datetime.utcnow())]
+    
+    # Should not raise exception, should return CoinGecko data
+    result = await price_collector.fetch_ohlcv(coin, timeframe, use_cache=False)
+    
+    # Property: System continues with available data
+    assert result is not None, "System should continue with secondary source when primary fails"
+    assert len(result) > 0, "Should return data from secondary source"
+    assert mock_binance.called, "Should attempt primary source first"
+    assert mock_coingecko.called, "Should failover to secondary source"
     
     # Test 2: When all sources fail but cache exists, should use stale cache
-    with patch.object(collector, '_fetch_binance_ohlcv', new_callable=AsyncMock) as mock_binance:
-        with patch.object(collector, '_fetch_coingecko_ohlcv', new_callable=AsyncMock) as mock_coingecko:
-            from utils.cache import cache
-            
-            # Simulate both sources failing
-            mock_binance.return_value = None
-            mock_coingecko.return_value = None
-            
-            # Set stale cache data
-            stale_data = [
-                {
-                    "timestamp": (datetime.utcnow() - timedelta(hours=2)).isoformat(),
-                    "open": 48000.0,
-                    "high": 49000.0,
-                    "low": 47000.0,
-                    "close": 48500.0,
-                    "volume": 900000.0
-                }
-            ]
-            cache.set_ohlcv(coin, timeframe, stale_data)
-            
-            # Should not raise exception, should return stale cache
-            result = await collector.fetch_ohlcv(coin, timeframe, use_cache=False)
-            
-            # Property: System uses stale cache when all sources fail
-            assert result is not None, "System should use stale cache when all sources fail"
-            assert len(result) > 0, "Should return stale cached data"
+    _reset(price_collector, mock_binance, mock_coingecko)
+    
+    # Simulate both sources failing
+    mock_binance.return_value = None
+    mock_coingecko.return_value = None
+    
+    # Set stale cache data
+    stale_data = [
+        _make_candle((datetime.utcnow() - timedelta(hours=2)).isoformat(), STALE_CANDLE_TEMPLATE)
+    ]
+    fake_cache.set_ohlcv(coin, timeframe, stale_data)
+    
+    # Should not raise exception, should return stale cache
+    result = await price_collector.fetch_ohlcv(coin, timeframe, use_cache=False)
+    
+    # Property: System uses stale cache when all sources fail
+    assert result is not None, "System should use stale cache when all sources fail"
+    assert len(result) > 0, "Should return stale cached data"
     
     # Test 3: When all sources fail and no cache, should raise APIUnavailableError
-    with patch.object(collector, '_fetch_binance_ohlcv', new_callable=AsyncMock) as mock_binance:
-        with patch.object(collector, '_fetch_coingecko_ohlcv', new_callable=AsyncMock) as mock_coingecko:
-            from utils.cache import cache
-            
-            # Simulate both sources failing
-            mock_binance.return_value = None
-            mock_coingecko.return_value = None
-            
-            # Clear cache
-            cache.delete(f"ohlcv:{coin}:{timeframe}")
-            
-            # Property: Should raise appropriate error when no data available
-            with pytest.raises(APIUnavailableError):
-                await collector.fetch_ohlcv(coin, timeframe, use_cache=False)
+    # (both sources still fail as in Test 2)
+    # Clear cache
+    fake_cache.delete(f"ohlcv:{coin}:{timeframe}")
+    
+    # Property: Should raise appropriate error when no data available
+    with pytest.raises(APIUnavailableError):
+        await price_collector.fetch_ohlcv(coin, timeframe, use_cache=False)
 
 
 @pytest.mark.asyncio
-@given(
-    coin=st.sampled_from(SUPPORTED_COINS),
-    platform=st.sampled_from(PLATFORMS)
-)
-@settings(max_examples=100, suppress_health_check=[HealthCheck.function_scoped_fixture])
-async def test_property_7_social_media_error_tolerance(coin, platform):
+@pytest.mark.parametrize("coin", SUPPORTED_COINS)
+@pytest.mark.parametrize("platform", PLATFORMS)
+async def test_property_7_social_media_error_tolerance(coin, platform, social_collector, social_mocks):
     """
     Feature: crypto-analysis-system, Property 7: Veri Toplama Hata Toleransı
     
@@ -136,40 +256,28 @@ async def test_property_7_social_media_error_tolerance(coin, platform):
     
     Validates: Gereksinim 5.4, 6.4, 14.2
     """
-    collector = SocialMediaCollector()
+    mock_twitter, mock_reddit = social_mocks
     
     # Test: When one platform fails, should continue with other platforms
-    with patch.object(collector, '_fetch_twitter_data', new_callable=AsyncMock) as mock_twitter:
-        with patch.object(collector, '_fetch_reddit_data', new_callable=AsyncMock) as mock_reddit:
-            # Simulate Twitter failure
-            mock_twitter.return_value = None
-            
-            # Reddit returns valid data
-            mock_reddit.return_value = [
-                {
-                    "text": "Test post about crypto",
-                    "created_at": datetime.utcnow().isoformat(),
-                    "score": 100,
-                    "source": "reddit"
-                }
-            ]
-            
-            # Should not raise exception
-            result = await collector.fetch_social_media(coin, platforms=["twitter", "reddit"], use_cache=False)
-            
-            # Property: System continues with available platforms
-            assert result is not None, "System should continue when one platform fails"
-            assert "twitter" in result, "Should include failed platform with empty data"
-            assert "reddit" in result, "Should include successful platform"
-            assert len(result["reddit"]) > 0, "Should have data from successful platform"
+    # Simulate Twitter failure
+    mock_twitter.return_value = None
+    
+    # Reddit returns valid data
+    mock_reddit.return_value = [_make_post(datetime.utcnow().isoformat())]
+    
+    # Should not raise exception
+    result = await social_collector.fetch_social_media(coin, platforms=["twitter", "reddit"], use_cache=False)
+    
+    # Property: System continues with available platforms
+    assert result is not None, "System should continue when one platform fails"
+    assert "twitter" in result, "Should include failed platform with empty data"
+    assert "reddit" in result, "Should include successful platform"
+    assert len(result["reddit"]) > 0, "Should have data from successful platform"
 
 
 @pytest.mark.asyncio
-@given(
-    coin=st.sampled_from(SUPPORTED_COINS)
-)
-@settings(max_examples=100, suppress_health_check=[HealthCheck.function_scoped_fixture])
-async def test_property_7_news_error_tolerance(coin):
+@pytest.mark.parametrize("coin", SUPPORTED_COINS)
+async def test_property_7_news_error_tolerance(coin, news_collector, news_mocks):
     """
     Feature: crypto-analysis-system, Property 7: Veri Toplama Hata Toleransı
     
@@ -177,33 +285,23 @@ async def test_property_7_news_error_tolerance(coin):
     
     Validates: Gereksinim 5.4, 6.4, 14.2
     """
-    collector = NewsCollector()
+    mock_coindesk, mock_cointelegraph = news_mocks
     
     # Test: When one news source fails, should continue with other sources
-    with patch.object(collector, '_fetch_coindesk_news', new_callable=AsyncMock) as mock_coindesk:
-        with patch.object(collector, '_fetch_cointelegraph_news', new_callable=AsyncMock) as mock_cointelegraph:
-            # Simulate CoinDesk failure
-            mock_coindesk.return_value = None
-            
-            # CoinTelegraph returns valid data
-            mock_cointelegraph.return_value = [
-                {
-                    "title": "Crypto news article",
-                    "description": "Article about cryptocurrency",
-                    "url": "https://example.com/article",
-                    "published": datetime.utcnow().isoformat(),
-                    "source": "cointelegraph"
-                }
-            ]
-            
-            # Should not raise exception
-            result = await collector.fetch_news(coin, use_cache=False)
-            
-            # Property: System continues with available sources
-            assert result is not None, "System should continue when one source fails"
-            assert len(result) > 0, "Should have data from successful source"
-            assert mock_coindesk.called, "Should attempt first source"
-            assert mock_cointelegraph.called, "Should try second source"
+    # Simulate CoinDesk failure
+    mock_coindesk.return_value = None
+    
+    # CoinTelegraph returns valid data
+    mock_cointelegraph.return_value = [_make_article(datetime.utcnow().isoformat())]
+    
+    # Should not raise exception
+    result = await news_collector.fetch_news(coin, use_cache=False)
+    
+    # Property: System continues with available sources
+    assert result is not None, "System should continue when one source fails"
+    assert len(result) > 0, "Should have data from successful source"
+    assert mock_coindesk.called, "Should attempt first source"
+    assert mock_cointelegraph.called, "Should try second source"
 
 
 
@@ -212,12 +310,9 @@ async def test_property_7_news_error_tolerance(coin):
 # ============================================================================
 
 @pytest.mark.asyncio
-@given(
-    coin=st.sampled_from(SUPPORTED_COINS),
-    timeframe=st.sampled_from(TIMEFRAMES)
-)
-@settings(max_examples=100, suppress_health_check=[HealthCheck.function_scoped_fixture])
-async def test_property_8_data_freshness_ohlcv(coin, timeframe):
+@pytest.mark.parametrize("coin", SUPPORTED_COINS)
+@pytest.mark.parametrize("timeframe", TIMEFRAMES)
+async def test_property_8_data_freshness_ohlcv(coin, timeframe, price_collector, ohlcv_mocks, fake_cache):
     """
     Feature: crypto-analysis-system, Property 8: Veri Tazeliği
     
@@ -226,56 +321,36 @@ async def test_property_8_data_freshness_ohlcv(coin, timeframe):
     
     Validates: Gereksinim 5.5
     """
-    from utils.cache import cache
-    collector = PriceDataCollector()
-    
     # Test 1: Fresh data should be within 24 hours
-    with patch.object(collector, '_fetch_binance_ohlcv', new_callable=AsyncMock) as mock_binance:
-        current_time = datetime.utcnow()
-        
-        # Mock returns fresh data
-        mock_binance.return_value = [
-            {
-                "timestamp": current_time - timedelta(minutes=5),
-                "open": 50000.0,
-                "high": 51000.0,
-                "low": 49000.0,
-                "close": 50500.0,
-                "volume": 1000000.0
-            }
-        ]
-        
-        # Fetch and cache data
-        result = await collector.fetch_ohlcv(coin, timeframe, use_cache=False)
-        
-        # Property: Cached data timestamp should be within 24 hours
-        assert result is not None
-        for candle in result:
-            timestamp = candle.get("timestamp")
-            if isinstance(timestamp, str):
-                timestamp = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-            
-            age = current_time - timestamp
-            assert age <= timedelta(hours=24), f"Data should be within 24 hours, but is {age.total_seconds() / 3600:.1f} hours old"
+    # Naive local time, as the collectors build timestamps
+    current_time = datetime.now()
+    now_s = int(time.time())
+    
+    mock_binance, _ = ohlcv_mocks
+    
+    # Mock returns fresh data
+    mock_binance.return_value = [_make_candle(current_time - timedelta(minutes=5))]
+    
+    # Fetch and cache data
+    result = await price_collector.fetch_ohlcv(coin, timeframe, use_cache=False)
+    
+    # Property: Cached data timestamp should be within 24 hours
+    assert result is not None
+    for candle in result:
+        age_s = now_s - to_epoch_seconds(candle["timestamp"])
+        assert age_s <= FRESHNESS_LIMIT_SECONDS, f"Data should be within 24 hours, but is {age_s / 3600:.1f} hours old"
     
     # Test 2: Verify cache TTL is set correctly
-    cache_key = f"ohlcv:{coin}:{timeframe}"
+    entry = fake_cache.get(f"ohlcv:{coin}:{timeframe}")
+    assert now_s < entry["exp"] <= int(time.time()) + fake_cache.ttl_ohlcv, \
+        "Cached OHLCV should carry an expiry within the OHLCV TTL"
     
     # Set data in cache
-    test_data = [
-        {
-            "timestamp": datetime.utcnow().isoformat(),
-            "open": 50000.0,
-            "high": 51000.0,
-            "low": 49000.0,
-            "close": 50500.0,
-            "volume": 1000000.0
-        }
-    ]
-    cache.set_ohlcv(coin, timeframe, test_data)
+    test_data = [_make_candle(datetime.utcnow().isoformat())]
+    fake_cache.set_ohlcv(coin, timeframe, test_data)
     
     # Property: Cache should exist and be retrievable
-    cached_data = cache.get_ohlcv(coin, timeframe)
+    cached_data = fake_cache.get_ohlcv(coin, timeframe)
     assert cached_data is not None, "Cached data should be retrievable"
     
     # Property: Cached data should match what was set
@@ -283,11 +358,8 @@ async def test_property_8_data_freshness_ohlcv(coin, timeframe):
 
 
 @pytest.mark.asyncio
-@given(
-    coin=st.sampled_from(SUPPORTED_COINS)
-)
-@settings(max_examples=100, suppress_health_check=[HealthCheck.function_scoped_fixture])
-async def test_property_8_data_freshness_price(coin):
+@pytest.mark.parametrize("coin", SUPPORTED_COINS)
+async def test_property_8_data_freshness_price(coin, price_collector, price_mock, fake_cache):
     """
     Feature: crypto-analysis-system, Property 8: Veri Tazeliği
     
@@ -295,40 +367,30 @@ async def test_property_8_data_freshness_price(coin):
     
     Validates: Gereksinim 5.5
     """
-    from utils.cache import cache
-    collector = PriceDataCollector()
-    
     # Test: Price data should be fresh
-    with patch.object(collector, '_fetch_binance_price', new_callable=AsyncMock) as mock_binance:
-        current_time = datetime.utcnow()
-        
-        # Mock returns price
-        mock_binance.return_value = 50000.0
-        
-        # Fetch and cache price
-        result = await collector.fetch_price(coin, use_cache=False)
-        
-        # Property: Price should be cached
-        assert result is not None
-        
-        # Get cached price
-        cached_price = cache.get_price(coin)
-        assert cached_price is not None, "Price should be cached"
-        
-        # Property: Cached price timestamp should be within 24 hours
-        timestamp_str = cached_price.get("timestamp")
-        if timestamp_str:
-            timestamp = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-            age = current_time - timestamp
-            assert age <= timedelta(hours=24), f"Price data should be within 24 hours, but is {age.total_seconds() / 3600:.1f} hours old"
+    now_s = int(time.time())
+    
+    # Mock returns price
+    price_mock.return_value = 50000.0
+    
+    # Fetch and cache price
+    result = await price_collector.fetch_price(coin, use_cache=False)
+    
+    # Property: Price should be cached
+    assert result is not None
+    
+    # Get cached price
+    cached_price = fake_cache.get_price(coin)
+    assert cached_price is not None, "Price should be cached"
+    
+    # Property: Cached price timestamp (epoch seconds) should be within 24 hours
+    age_s = now_s - cached_price["timestamp"]
+    assert age_s <= FRESHNESS_LIMIT_SECONDS, f"Price data should be within 24 hours, but is {age_s / 3600:.1f} hours old"
 
 
 @pytest.mark.asyncio
-@given(
-    coin=st.sampled_from(SUPPORTED_COINS),
-    platform=st.sampled_from(PLATFORMS)
-)
-@settings(max_examples=100, suppress_health_check=[HealthCheck.function_scoped_fixture])
+@pytest.mark.parametrize("coin", SUPPORTED_COINS)
+@pytest.mark.parametrize("platform", PLATFORMS)
 async def test_property_8_data_freshness_social(coin, platform):
     """
     Feature: crypto-analysis-system, Property 8: Veri Tazeliği
@@ -337,17 +399,13 @@ async def test_property_8_data_freshness_social(coin, platform):
     
     Validates: Gereksinim 5.5
     """
-    from utils.cache import cache
-    
     # Test: Social media data should be fresh when cached
-    current_time = datetime.utcnow()
+    # Naive local time, as the collectors build timestamps
+    current_time = datetime.now()
+    now_s = int(time.time())
     
     test_data = [
-        {
-            "text": "Test post",
-            "created_at": (current_time - timedelta(hours=2)).isoformat(),
-            "source": platform
-        }
+        _make_post((current_time - timedelta(hours=2)).isoformat(), text="Test post", source=platform)
     ]
     
     # Cache the data
@@ -359,19 +417,14 @@ async def test_property_8_data_freshness_social(coin, platform):
     
     # Property: Data timestamps should be within reasonable range
     for post in cached_data:
-        created_at_str = post.get("created_at")
-        if created_at_str:
-            created_at = datetime.fromisoformat(created_at_str.replace('Z', '+00:00'))
-            age = current_time - created_at
+        created_at = to_epoch_seconds(post.get("created_at"))
+        if created_at is not None:
             # Social media posts can be up to 24 hours old
-            assert age <= timedelta(hours=24), f"Social media post should be within 24 hours"
+            assert now_s - created_at <= FRESHNESS_LIMIT_SECONDS, f"Social media post should be within 24 hours"
 
 
 @pytest.mark.asyncio
-@given(
-    coin=st.sampled_from(SUPPORTED_COINS)
-)
-@settings(max_examples=100, suppress_health_check=[HealthCheck.function_scoped_fixture])
+@pytest.mark.parametrize("coin", SUPPORTED_COINS)
 async def test_property_8_data_freshness_news(coin):
     """
     Feature: crypto-analysis-system, Property 8: Veri Tazeliği
@@ -380,19 +433,13 @@ async def test_property_8_data_freshness_news(coin):
     
     Validates: Gereksinim 5.5
     """
-    from utils.cache import cache
-    
     # Test: News data should be fresh when cached
-    current_time = datetime.utcnow()
+    # Naive local time, as the collectors build timestamps
+    current_time = datetime.now()
+    now_s = int(time.time())
     
     test_data = [
-        {
-            "title": "Test news",
-            "description": "Test description",
-            "url": "https://example.com",
-            "published": (current_time - timedelta(hours=3)).isoformat(),
-            "source": "coindesk"
-        }
+        _make_article((current_time - timedelta(hours=3)).isoformat(), source="coindesk")
     ]
     
     # Cache the data
@@ -404,16 +451,42 @@ async def test_property_8_data_freshness_news(coin):
     
     # Property: News articles should be reasonably fresh
     for article in cached_data:
-        published_str = article.get("published")
-        if published_str:
-            try:
-                published = datetime.fromisoformat(published_str.replace('Z', '+00:00'))
-                age = current_time - published
-                # News can be up to 24 hours old
-                assert age <= timedelta(hours=24), f"News article should be within 24 hours"
-            except (ValueError, AttributeError):
-                # If parsing fails, skip timestamp check
-                pass
+        # Unparseable timestamps yield None and skip the check
+        published = to_epoch_seconds(article.get("published"))
+        if published is not None:
+            # News can be up to 24 hours old
+            assert now_s - published <= FRESHNESS_LIMIT_SECONDS, f"News article should be within 24 hours"
+
+
+def test_expired_ohlcv_entry_is_not_returned(fake_cache):
+    """Test that an OHLCV entry past its expiry epoch reads as a miss."""
+    key = "ohlcv:BTC:1h"
+    candles = [dict(CANDLE_TEMPLATE)]
+    
+    fake_cache.set(key, {"exp": int(time.time()) - 1, "data": candles})
+    assert fake_cache.get_ohlcv("BTC", "1h") is None
+    
+    fake_cache.set(key, {"exp": int(time.time()) + 60, "data": candles})
+    assert fake_cache.get_ohlcv("BTC", "1h") == candles
+    
+    fake_cache.delete(key)
+
+
+@pytest.mark.asyncio
+async def test_price_collectors_share_http_session():
+    """Test that collectors pool one HTTP session per event loop."""
+    first, second = PriceDataCollector(), PriceDataCollector()
+    
+    try:
+        session = first._get_session()
+        assert second._get_session() is session, "Collectors should reuse the pooled session"
+    finally:
+        await PriceDataCollector.close_shared_session()
+    
+    assert session.closed
+    
+    injected = MagicMock()
+    assert PriceDataCollector(session=injected)._get_session() is injected
 
 
 # ============================================================================
@@ -424,11 +497,13 @@ async def test_property_8_data_freshness_news(coin):
 async def test_retry_mechanism_exponential_backoff():
     """Test that retry mechanism uses exponential backoff."""
     collector = PriceDataCollector()
+    collector.retry_delay = 0.1  # keep the test fast; delays scale with the base
+    loop = asyncio.get_running_loop()
     
     call_times = []
     
     async def failing_func():
-        call_times.append(datetime.utcnow())
+        call_times.append(loop.time())
         raise Exception("Test error")
     
     # Should retry 3 times with exponential backoff
@@ -437,14 +512,12 @@ async def test_retry_mechanism_exponential_backoff():
     assert result is None, "Should return None after all retries fail"
     assert len(call_times) == 3, "Should retry exactly 3 times"
     
-    # Check exponential backoff (approximately)
-    if len(call_times) >= 2:
-        delay1 = (call_times[1] - call_times[0]).total_seconds()
-        assert delay1 >= 1.0, "First retry should wait at least 1 second"
+    # Check exponential backoff (jitter only ever adds to the delay)
+    delay1 = call_times[1] - call_times[0]
+    assert delay1 >= 0.1, "First retry should wait at least the base delay"
     
-    if len(call_times) >= 3:
-        delay2 = (call_times[2] - call_times[1]).total_seconds()
-        assert delay2 >= 2.0, "Second retry should wait at least 2 seconds"
+    delay2 = call_times[2] - call_times[1]
+    assert delay2 >= 0.2, "Second retry should wait at least twice the base delay"
 
 
 @pytest.mark.asyncio
@@ -464,3 +537,136 @@ async def test_retry_mechanism_success_on_retry():
     
     assert result == "success", "Should return success after retry"
     assert attempt_count[0] == 2, "Should succeed on second attempt"
+
+
+@pytest.mark.asyncio
+async def test_retry_mechanism_max_attempts_override():
+    """Test that max_attempts=1 makes a single attempt without sleeping."""
+    collector = PriceDataCollector()
+    failing_func = AsyncMock(side_effect=Exception("Test error"))
+    
+    with patch('engines.data_collector.asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+        result = await collector._retry_request(failing_func, max_attempts=1)
+    
+    assert result is None
+    assert failing_func.await_count == 1
+    assert not mock_sleep.called, "Single attempt should not back off"
+
+
+@pytest.mark.asyncio
+async def test_retry_mechanism_attempt_timeout():
+    """Test that a hanging attempt is abandoned after attempt_timeout."""
+    collector = PriceDataCollector()
+    
+    async def hanging_func():
+        await asyncio.sleep(10)
+        return "too late"
+    
+    result = await asyncio.wait_for(
+        collector._retry_request(hanging_func, max_attempts=1, attempt_timeout=0.05), timeout=2
+    )
+    
+    assert result is None, "Timed out attempt should count as a failure"
+
+
+@pytest.mark.asyncio
+async def test_retry_mechanism_circuit_breaker():
+    """Test that repeated failures open the circuit and skip backoff sleeps."""
+    collector = PriceDataCollector()
+    failing_func = AsyncMock(side_effect=Exception("Test error"))
+    
+    for _ in range(collector.circuit_breaker_threshold):
+        await collector._retry_request(failing_func, max_attempts=1)
+    
+    failing_func.reset_mock()
+    with patch('engines.data_collector.asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+        result = await collector._retry_request(failing_func)
+    
+    assert result is None
+    assert failing_func.await_count == 1, "Open circuit should only probe once"
+    assert not mock_sleep.called, "Open circuit should not back off"
+    
+    # A success closes the circuit again
+    failing_func.side_effect = None
+    failing_func.return_value = "ok"
+    assert await collector._retry_request(failing_func) == "ok"
+    assert collector._failure_counts == {}
+
+
+@pytest.mark.asyncio
+async def test_fetch_ohlcv_hedges_slow_primary():
+    """Test that a slow primary source is hedged by the secondary source."""
+    collector = PriceDataCollector()
+    collector.hedge_delay = 0.01
+    
+    candles = [_make_candle(datetime.utcnow())]
+    
+    binance_cancelled = asyncio.Event()
+    
+    async def slow_binance(*args, **kwargs):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            binance_cancelled.set()
+            raise
+        return []
+    
+    with patch.object(collector, '_fetch_binance_ohlcv', side_effect=slow_binance) as mock_binance:
+        with patch.object(collector, '_fetch_coingecko_ohlcv', new_callable=AsyncMock) as mock_coingecko:
+            mock_coingecko.return_value = candles
+            
+            result = await asyncio.wait_for(
+                collector.fetch_ohlcv("BTC", "1h", use_cache=False), timeout=2
+            )
+    
+    assert result == candles, "Should return the hedged secondary source's candles"
+    assert mock_binance.called, "Should query primary source"
+    assert mock_coingecko.called, "Should hedge with secondary source"
+    assert binance_cancelled.is_set(), "Losing primary request should be cancelled before returning"
+
+
+@pytest.mark.asyncio
+async def test_fetch_ohlcv_skips_secondary_when_primary_succeeds():
+    """Test that a fast, successful primary source is not hedged."""
+    collector = PriceDataCollector()
+    candles = [_make_candle(datetime.utcnow())]
+    
+    with patch.object(collector, '_fetch_binance_ohlcv', new_callable=AsyncMock) as mock_binance:
+        with patch.object(collector, '_fetch_coingecko_ohlcv', new_callable=AsyncMock) as mock_coingecko:
+            mock_binance.return_value = candles
+            
+            result = await collector.fetch_ohlcv("BTC", "1h", use_cache=False)
+    
+    assert result == candles
+    assert mock_coingecko.called is False, "Secondary source should not be queried"
+
+
+@pytest.mark.asyncio
+async def test_swr_returns_stale_and_refreshes(fake_cache):
+    """Test that stale cached OHLCV is served at once and refreshed in the background."""
+    collector = PriceDataCollector()
+    stale = [_make_candle((datetime.utcnow() - timedelta(hours=1)).isoformat(), STALE_CANDLE_TEMPLATE)]
+    fresh = [_make_candle(datetime.utcnow().isoformat())]
+    
+    fake_cache.set("ohlcv:BTC:1h", {"exp": int(time.time()) - 1, "data": stale})
+    
+    async def slow_binance(*args, **kwargs):
+        await asyncio.sleep(0.2)
+        return fresh
+    
+    with patch.object(collector, '_fetch_binance_ohlcv', side_effect=slow_binance):
+        with patch.object(collector, '_fetch_coingecko_ohlcv', new_callable=AsyncMock) as mock_coingecko:
+            mock_coingecko.return_value = []
+            
+            result = await collector.fetch_ohlcv("BTC", "1h")
+            refresh = collector._refresh_tasks[("BTC", "1h")]
+            
+            assert result == stale, "Should serve the stale candles without waiting"
+            assert not refresh.done(), "Refresh should still be running in the background"
+            
+            await refresh
+    
+    assert fake_cache.get_ohlcv("BTC", "1h") == fresh, "Background refresh should update the cache"
+    assert not collector._refresh_tasks, "Finished refresh should be forgotten"
+    
+    fake_cache.delete("ohlcv:BTC:1h")
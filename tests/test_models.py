@@ -4,14 +4,28 @@ Basic tests for database and Pydantic models.
 import pytest
 from datetime import datetime
 from decimal import Decimal
+from typing import NamedTuple, Optional, Type
+
+from models.database import (
+    Base, User, Analysis, PortfolioHolding,
+    TradeHistory, Alarm, AlarmHistory, Backtest
+)
+from models.schemas import (
+    SignalType, IndicatorResults, SentimentResults,
+    Signal, AnalysisResult, Portfolio, Holding,
+    Alarm as AlarmSchema, BacktestResult,
+    AnalysisRequest, PortfolioAddRequest
+)
+
+# Build the validators for the schemas exercised below once at import time,
+# so no individual test pays for schema completion.
+Signal.model_rebuild()
+AnalysisRequest.model_rebuild()
+
 
 # Test imports
 def test_database_models_import():
     """Test that database models can be imported."""
-    from models.database import (
-        Base, User, Analysis, PortfolioHolding, 
-        TradeHistory, Alarm, AlarmHistory, Backtest
-    )
     assert Base is not None
     assert User is not None
     assert Analysis is not None
@@ -24,11 +38,6 @@ def test_database_models_import():
 
 def test_pydantic_models_import():
     """Test that Pydantic models can be imported."""
-    from models.schemas import (
-        SignalType, IndicatorResults, SentimentResults,
-        Signal, AnalysisResult, Portfolio, Holding,
-        Alarm as AlarmSchema, BacktestResult
-    )
     assert SignalType is not None
     assert IndicatorResults is not None
     assert SentimentResults is not None
@@ -42,8 +51,6 @@ def test_pydantic_models_import():
 
 def test_signal_type_enum():
     """Test SignalType enum values."""
-    from models.schemas import SignalType
-    
     assert SignalType.STRONG_BUY == "STRONG_BUY"
     assert SignalType.BUY == "BUY"
     assert SignalType.NEUTRAL == "NEUTRAL"
@@ -52,94 +59,97 @@ def test_signal_type_enum():
     assert SignalType.UNCERTAIN == "UNCERTAIN"
 
 
-def test_analysis_request_validation():
-    """Test AnalysisRequest validation."""
-    from models.schemas import AnalysisRequest
-    
-    # Valid request
-    request = AnalysisRequest(coin="BTC", timeframe="1h")
-    assert request.coin == "BTC"
-    assert request.timeframe == "1h"
-    
-    # Coin should be uppercased
-    request = AnalysisRequest(coin="eth", timeframe="4h")
-    assert request.coin == "ETH"
-    
-    # Invalid timeframe should raise error
-    with pytest.raises(ValueError):
-        AnalysisRequest(coin="BTC", timeframe="invalid")
-
-
-def test_sentiment_results_validation():
-    """Test SentimentResults validation."""
-    from models.schemas import SentimentResults
-    
-    # Valid sentiment
-    sentiment = SentimentResults(
-        source="twitter",
-        sentiment_score=0.5,
-        confidence=0.8,
-        sample_size=100,
-        timestamp=datetime.utcnow()
-    )
-    assert sentiment.source == "twitter"
-    assert -1 <= sentiment.sentiment_score <= 1
-    assert 0 <= sentiment.confidence <= 1
-    
-    # Invalid sentiment score should raise error
-    with pytest.raises(ValueError):
-        SentimentResults(
-            source="twitter",
-            sentiment_score=2.0,  # Out of range
-            confidence=0.8,
-            sample_size=100,
-            timestamp=datetime.utcnow()
-        )
-
-
-def test_signal_model():
-    """Test Signal model creation."""
-    from models.schemas import Signal, SignalType
-    
-    signal = Signal(
-        signal_type=SignalType.BUY,
-        success_probability=75.5,
-        timestamp=datetime.utcnow(),
-        coin="BTC",
-        timeframe="1h",
-        stop_loss=45000.0,
-        take_profit=52000.0,
-        ema_200_filter_applied=True
-    )
-    
-    assert signal.signal_type == SignalType.BUY
-    assert signal.success_probability == 75.5
-    assert signal.coin == "BTC"
-    assert signal.stop_loss == 45000.0
-
-
-def test_portfolio_add_request_validation():
-    """Test PortfolioAddRequest validation."""
-    from models.schemas import PortfolioAddRequest
-    
-    # Valid request
-    request = PortfolioAddRequest(
-        coin="btc",
-        amount=Decimal("0.5"),
-        purchase_price=Decimal("50000.00"),
-        purchase_date=datetime.utcnow()
-    )
-    assert request.coin == "BTC"  # Should be uppercased
-    assert request.amount == Decimal("0.5")
+class SchemaCase(NamedTuple):
+    """One schema validation case: build model(**kwargs), then check the outcome."""
+    model: type
+    kwargs: dict
+    expected_err: Optional[Type[Exception]] = None
+    expected: Optional[dict] = None
+
+
+NOW = datetime.utcnow()
+
+SENTIMENT_KWARGS = {
+    "source": "twitter",
+    "sentiment_score": 0.5,
+    "confidence": 0.8,
+    "sample_size": 100,
+    "timestamp": NOW
+}
+
+PORTFOLIO_ADD_KWARGS = {
+    "coin": "btc",
+    "amount": Decimal("0.5"),
+    "purchase_price": Decimal("50000.00"),
+    "purchase_date": NOW
+}
+
+SCHEMA_CASES = {
+    # AnalysisRequest: valid request, coin uppercased, invalid timeframe
+    "analysis_request_valid": SchemaCase(
+        AnalysisRequest, {"coin": "BTC", "timeframe": "1h"},
+        expected={"coin": "BTC", "timeframe": "1h"}
+    ),
+    "analysis_request_uppercases_coin": SchemaCase(
+        AnalysisRequest, {"coin": "eth", "timeframe": "4h"},
+        expected={"coin": "ETH"}
+    ),
+    "analysis_request_invalid_timeframe": SchemaCase(
+        AnalysisRequest, {"coin": "BTC", "timeframe": "invalid"},
+        expected_err=ValueError
+    ),
+    # SentimentResults: valid sentiment, score out of range
+    "sentiment_results_valid": SchemaCase(
+        SentimentResults, SENTIMENT_KWARGS,
+        expected={"source": "twitter", "sentiment_score": 0.5, "confidence": 0.8}
+    ),
+    "sentiment_results_score_out_of_range": SchemaCase(
+        SentimentResults, {**SENTIMENT_KWARGS, "sentiment_score": 2.0},
+        expected_err=ValueError
+    ),
+    # Signal model creation
+    "signal_valid": SchemaCase(
+        Signal,
+        {
+            "signal_type": SignalType.BUY,
+            "success_probability": 75.5,
+            "timestamp": NOW,
+            "coin": "BTC",
+            "timeframe": "1h",
+            "stop_loss": 45000.0,
+            "take_profit": 52000.0,
+            "ema_200_filter_applied": True
+        },
+        expected={
+            "signal_type": SignalType.BUY,
+            "success_probability": 75.5,
+            "coin": "BTC",
+            "stop_loss": 45000.0
+        }
+    ),
+    # PortfolioAddRequest: coin uppercased, negative amount
+    "portfolio_add_request_valid": SchemaCase(
+        PortfolioAddRequest, PORTFOLIO_ADD_KWARGS,
+        expected={"coin": "BTC", "amount": Decimal("0.5")}
+    ),
+    "portfolio_add_request_negative_amount": SchemaCase(
+        PortfolioAddRequest, {**PORTFOLIO_ADD_KWARGS, "coin": "BTC", "amount": Decimal("-0.5")},
+        expected_err=ValueError
+    ),
+}
+
+
+@pytest.mark.parametrize("case", list(SCHEMA_CASES.values()), ids=list(SCHEMA_CASES))
+def test_schema_validation(case):
+    """Test Pydantic schema validation from the SCHEMA_CASES table."""
+    if case.expected_err:
+        with pytest.raises(case.expected_err):
+            case.model(**case.kwargs)
+        return
     
-    # Invalid amount should raise error
-    with pytest.raises(ValueError):
-        PortfolioAddRequest(
-            coin="BTC",
-            amount=Decimal("-0.5"),  # Negative amount
-            purchase_price=Decimal("50000.00"),
-            purchase_date=datetime.utcnow()
-        )
+    instance = case.model(**case.kwargs)
+    for field, value in (case.expected or {}).items():
+        assert getattr(instance, field) == value
 
 
 def test_cache_import():
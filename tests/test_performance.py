@@ -2,6 +2,8 @@
 Property-based tests for performance requirements.
 Tests analysis performance and cache acceleration.
 """
+import asyncio
+import itertools
 import pytest
 from hypothesis import given, strategies as st, settings, HealthCheck
 from datetime import datetime
@@ -11,6 +13,7 @@ from engines.fundamental_analysis import FundamentalAnalysisEngine
 from engines.signal_generator import SignalGenerator
 from engines.ai_interpreter import AIInterpreter
 from engines.data_collector import DataCollector
+from models.schemas import SentimentClassification, TrendDirection, OverallSentiment
 from utils.cache import cache
 
 
@@ -18,6 +21,10 @@ from utils.cache import cache
 SUPPORTED_COINS = ["BTC", "ETH", "BNB", "XRP", "ADA"]
 TIMEFRAMES = ["15m", "1h", "4h", "8h", "12h", "24h", "1w"]
 
+# Every other coin/timeframe pair: 18 of the 35, covering each coin and
+# each timeframe (7 timeframes is odd, so the parity alternates per coin)
+ANALYSIS_CASES = list(itertools.product(SUPPORTED_COINS, TIMEFRAMES))[::2]
+
 
 @pytest.fixture(scope="module")
 def engines():
@@ -33,15 +40,7 @@ def engines():
 
 @pytest.mark.performance
 @pytest.mark.asyncio
-@given(
-    coin=st.sampled_from(SUPPORTED_COINS),
-    timeframe=st.sampled_from(TIMEFRAMES)
-)
-@settings(
-    max_examples=20,  # Reduced for performance tests
-    deadline=35000,  # 35 seconds to allow for 30s requirement + overhead
-    suppress_health_check=[HealthCheck.too_slow, HealthCheck.function_scoped_fixture]
-)
+@pytest.mark.parametrize("coin,timeframe", ANALYSIS_CASES)
 async def test_property_23_analysis_performance(coin, timeframe, engines):
     """
     Feature: crypto-analysis-system, Property 23: Analiz Performansı
@@ -55,24 +54,24 @@ async def test_property_23_analysis_performance(coin, timeframe, engines):
     try:
         # Step 1: Collect data
         data_collector = engines["data_collector"]
-        ohlcv_data = data_collector.fetch_ohlcv(coin, timeframe)
+        ohlcv_data = await data_collector.fetch_ohlcv(coin, timeframe)
         
-        # Step 2: Technical analysis
         technical_engine = engines["technical"]
         df = technical_engine.process_ohlcv_data(ohlcv_data)
-        technical_results = technical_engine.calculate_indicators(df)
         
-        # Step 3: Fundamental analysis (simplified for performance test)
-        fundamental_engine = engines["fundamental"]
-        # Create mock sentiment results for performance test
-        from models.schemas import SentimentResults, SentimentClassification, TrendDirection, OverallSentiment
-        mock_sentiment = OverallSentiment(
-            overall_score=0.5,
-            classification=SentimentClassification.NEUTRAL,
-            trend=TrendDirection.STABLE,
-            sources=[]
+        # Steps 2 and 3 are independent: run technical analysis in a worker
+        # thread while the fundamental result is built
+        # (fundamental analysis is simplified to a mock result for this test)
+        technical_results, fundamental_results = await asyncio.gather(
+            asyncio.to_thread(technical_engine.calculate_indicators, df),
+            asyncio.to_thread(
+                OverallSentiment,
+                overall_score=0.5,
+                classification=SentimentClassification.NEUTRAL,
+                trend=TrendDirection.STABLE,
+                sources=[]
+            )
         )
-        fundamental_results = mock_sentiment
         
         # Step 4: Generate signal
         signal, explanation = engines["signal"].generate_signal(
@@ -114,7 +113,9 @@ async def test_property_23_analysis_performance(coin, timeframe, engines):
         raise
 
 
+@pytest.mark.integration
 @pytest.mark.performance
+@pytest.mark.usefixtures("redis_cache")
 @given(
     coin=st.sampled_from(SUPPORTED_COINS),
     timeframe=st.sampled_from(TIMEFRAMES)
@@ -144,9 +145,6 @@ def test_property_25_cache_acceleration(coin, timeframe):
     cache.set_price(coin, test_price)
     time_1 = time.time() - start_time_1
     
-    # Small delay to ensure cache is written
-    time.sleep(0.1)
-    
     # Second request (cache hit) - get data
     start_time_2 = time.time()
     cached_price = cache.get_price(coin)
@@ -163,7 +161,9 @@ def test_property_25_cache_acceleration(coin, timeframe):
     assert cached_price["price"] == test_price
 
 
+@pytest.mark.integration
 @pytest.mark.performance
+@pytest.mark.usefixtures("redis_cache")
 def test_cache_invalidation():
     """
     Test cache invalidation strategies.
@@ -193,7 +193,9 @@ def test_cache_invalidation():
     assert cache.get_news(test_coin) is None
 
 
+@pytest.mark.integration
 @pytest.mark.performance
+@pytest.mark.usefixtures("redis_cache")
 def test_cache_stats():
     """
     Test cache statistics retrieval.
@@ -221,7 +223,9 @@ def test_cache_stats():
         assert 0 <= stats["hit_rate"] <= 100
 
 
+@pytest.mark.integration
 @pytest.mark.performance
+@pytest.mark.usefixtures("redis_cache")
 def test_batch_cache_operations():
     """
     Test batch cache operations for efficiency.
@@ -262,7 +266,9 @@ def test_batch_cache_operations():
         cache.delete(key)
 
 
+@pytest.mark.integration
 @pytest.mark.performance
+@pytest.mark.usefixtures("redis_cache")
 def test_cache_ttl_operations():
     """
     Test TTL (time to live) operations.
@@ -294,5 +300,26 @@ def test_cache_ttl_operations():
     cache.delete(test_key)
 
 
+# Runs last: the module-scoped fake_cache keeps the global cache on
+# FakeRedisClient until the module tears down
+@pytest.mark.performance
+def test_mset_mget_round_trip(fake_cache):
+    """Test that mset writes through the pipeline and mget reads it back."""
+    mapping = {"test:mset:a": {"price": 1.5}, "test:mset:b": [1, 2, 3]}
+    
+    # With a TTL every key is written with SET EX
+    assert fake_cache.mset(mapping, ttl=30) is True
+    assert fake_cache.mget(list(mapping) + ["test:mset:missing"]) == [{"price": 1.5}, [1, 2, 3], None]
+    assert all(fake_cache.client.ttl(key) == 30 for key in mapping)
+    
+    # Without a TTL the keys are written with MSET and persist
+    assert fake_cache.mset(mapping) is True
+    assert fake_cache.mget(list(mapping)) == [{"price": 1.5}, [1, 2, 3]]
+    assert all(fake_cache.client.ttl(key) == -1 for key in mapping)
+    
+    for key in mapping:
+        fake_cache.delete(key)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-m", "performance"])
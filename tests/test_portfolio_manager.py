@@ -2,14 +2,18 @@
 Unit and property-based tests for Portfolio Manager.
 Tests portfolio CRUD operations, calculations, and trade history.
 """
+import time
 import pytest
 from hypothesis import given, strategies as st, settings, assume
-from datetime import datetime, timedelta
-from decimal import Decimal
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal, localcontext
+from contextlib import contextmanager
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
 from models.database import Base, User, PortfolioHolding, TradeHistory
 from engines.portfolio_manager import PortfolioManager, HoldingNotFoundError, PortfolioManagerError
+from engines.data_collector import DataCollector
 from unittest.mock import AsyncMock, patch, MagicMock
 import uuid
 
@@ -18,26 +22,82 @@ import uuid
 # Test Setup
 # ============================================================================
 
-@pytest.fixture
-def db_session():
-    """Create an in-memory SQLite database for testing."""
-    engine = create_engine("sqlite:///:memory:")
-    Base.metadata.create_all(engine)
-    Session = sessionmaker(bind=engine)
-    session = Session()
-    
-    # Create a test user
-    user = User(
-        id=str(uuid.uuid4()),
-        email="test@example.com",
-        password_hash="hashed_password"
+@pytest.fixture(scope="module")
+def db_engine():
+    """Create an in-memory SQLite database with the schema, once per module."""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+        # Room for every statement shape the module compiles, so repeated
+        # add_coin/get_portfolio calls always hit the compiled-SQL cache
+        query_cache_size=1200
     )
-    session.add(user)
-    session.commit()
     
-    yield session, user.id
+    # pysqlite defers BEGIN to the first DML statement, so a SAVEPOINT could
+    # open (and its RELEASE commit) the real transaction. Emit BEGIN ourselves
+    # so everything a test writes stays inside the outer transaction.
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_begin(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+    
+    # The database is thrown away with the module: skip syncing and keep the
+    # rollback journal and temp tables in memory
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+    
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+    
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(scope="module")
+def db_user_id(db_engine):
+    """Insert the test user once per module, outside any test transaction."""
+    user_id = str(uuid.uuid4())
+    with db_engine.begin() as conn:
+        conn.execute(User.__table__.insert().values(
+            id=user_id,
+            email="test@example.com",
+            password_hash="hashed_password"
+        ))
+    return user_id
+
+
+@contextmanager
+def rollback_session(engine):
+    """
+    Open a session whose writes are discarded on exit.
     
-    session.close()
+    The session joins an outer transaction and turns its own commit() calls
+    into savepoint releases, so code under test can commit normally while
+    the outer rollback wipes every row without re-running the DDL.
+    """
+    connection = engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
+    try:
+        yield session
+    finally:
+        session.close()
+        transaction.rollback()
+        connection.close()
+
+
+@pytest.fixture
+def db_session(db_engine, db_user_id):
+    """Create a database session for testing, rolled back afterwards."""
+    with rollback_session(db_engine) as session:
+        yield session, db_user_id
 
 
 @pytest.fixture
@@ -47,6 +107,38 @@ def portfolio_manager(db_session):
     return PortfolioManager(session, user_id)
 
 
+# Current prices returned by the stubbed DataCollector.fetch_price
+PRICE_MAP = {}
+
+
+async def _fetch_price_stub(self, coin, use_cache=True):
+    """Look up the current price of a coin in PRICE_MAP."""
+    return PRICE_MAP.get(coin)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def stub_fetch_price():
+    """
+    Replace DataCollector.fetch_price with a PRICE_MAP lookup for the module.
+    
+    Property tests set PRICE_MAP per example instead of entering a new
+    AsyncMock patch each time; unit tests that patch the instance still win.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(DataCollector, "fetch_price", _fetch_price_stub)
+        yield
+
+
+def dec_close(actual, expected, rel=Decimal("1e-4"), abs_tol=Decimal("1e-12")):
+    """
+    Decimal counterpart of pytest.approx(expected, rel=rel).
+    
+    Compares in Decimal arithmetic instead of building an approx object per
+    assertion; abs_tol mirrors approx's default absolute tolerance near zero.
+    """
+    return abs(actual - expected) <= max(rel * abs(expected), abs_tol)
+
+
 # ============================================================================
 # Hypothesis Strategies
 # ============================================================================
@@ -54,12 +146,13 @@ def portfolio_manager(db_session):
 SUPPORTED_COINS = ["BTC", "ETH", "ADA", "SOL", "DOT", "BNB", "XRP", "DOGE", "AVAX", "MATIC"]
 
 coin_strategy = st.sampled_from(SUPPORTED_COINS)
-amount_strategy = st.decimals(min_value=Decimal("0.001"), max_value=Decimal("1000"), places=8)
-price_strategy = st.decimals(min_value=Decimal("0.01"), max_value=Decimal("100000"), places=8)
-date_strategy = st.datetimes(
-    min_value=datetime(2020, 1, 1),
-    max_value=datetime.utcnow()
-)
+# Decimals with 8 places, drawn as integer counts of 1e-8 (no quantizing per draw)
+amount_strategy = st.integers(min_value=10**5, max_value=10**11).map(lambda n: Decimal(n).scaleb(-8))  # 0.001 - 1000
+price_strategy = st.integers(min_value=10**6, max_value=10**13).map(lambda n: Decimal(n).scaleb(-8))  # 0.01 - 100000
+# Naive UTC datetimes from whole epoch seconds (2020-01-01 until now)
+DATE_MIN_EPOCH = int(datetime(2020, 1, 1, tzinfo=timezone.utc).timestamp())
+DATE_MAX_EPOCH = int(time.time())
+date_strategy = st.integers(min_value=DATE_MIN_EPOCH, max_value=DATE_MAX_EPOCH).map(datetime.utcfromtimestamp)
 
 
 # ============================================================================
@@ -170,20 +263,17 @@ async def test_get_portfolio_with_holdings(portfolio_manager, db_session):
         purchase_date=datetime(2024, 1, 1)
     )
     
-    # Mock price fetching
-    with patch.object(portfolio_manager.data_collector, 'fetch_price', new_callable=AsyncMock) as mock_fetch:
-        mock_fetch.side_effect = lambda coin: {
-            "BTC": 60000.0,
-            "ETH": 2500.0
-        }.get(coin)
-        
-        portfolio = await portfolio_manager.get_portfolio()
-        
-        assert len(portfolio.holdings) == 2
-        assert portfolio.total_invested == Decimal("70000")  # 50000 + 20000
-        assert portfolio.total_value == Decimal("85000")  # 60000 + 25000
-        assert portfolio.total_profit_loss == Decimal("15000")
-        assert portfolio.total_profit_loss_percent == pytest.approx(21.43, rel=0.01)
+    # Current prices via the module-wide fetch_price stub
+    PRICE_MAP.clear()
+    PRICE_MAP.update({"BTC": 60000.0, "ETH": 2500.0})
+    
+    portfolio = await portfolio_manager.get_portfolio()
+    
+    assert len(portfolio.holdings) == 2
+    assert portfolio.total_invested == Decimal("70000")  # 50000 + 20000
+    assert portfolio.total_value == Decimal("85000")  # 60000 + 25000
+    assert portfolio.total_profit_loss == Decimal("15000")
+    assert portfolio.total_profit_loss_percent == pytest.approx(21.43, rel=0.01)
 
 
 def test_get_trade_history(portfolio_manager, db_session):
@@ -234,7 +324,7 @@ def test_get_trade_history(portfolio_manager, db_session):
     purchase_date=date_strategy
 )
 @settings(max_examples=100, deadline=None)
-def test_property_37_portfolio_addition(coin, amount, purchase_price, purchase_date):
+def test_property_37_portfolio_addition(db_engine, db_user_id, coin, amount, purchase_price, purchase_date):
     """
     Feature: crypto-analysis-system, Property 37: Portföy Ekleme
     
@@ -243,61 +333,46 @@ def test_property_37_portfolio_addition(coin, amount, purchase_price, purchase_d
     
     Validates: Gereksinim 17.1, 17.2
     """
-    # Create fresh database session for each test
-    engine = create_engine("sqlite:///:memory:")
-    Base.metadata.create_all(engine)
-    Session = sessionmaker(bind=engine)
-    session = Session()
-    
-    # Create test user
-    user = User(
-        id=str(uuid.uuid4()),
-        email="test@example.com",
-        password_hash="hashed_password"
-    )
-    session.add(user)
-    session.commit()
-    user_id = user.id
-    
-    # Create portfolio manager
-    portfolio_manager = PortfolioManager(session, user_id)
-    
-    # Add coin to portfolio
-    holding_id = portfolio_manager.add_coin(
-        coin=coin,
-        amount=amount,
-        purchase_price=purchase_price,
-        purchase_date=purchase_date
-    )
+    user_id = db_user_id
     
-    # Verify holding was created
-    assert holding_id is not None
-    assert isinstance(holding_id, str)
-    
-    # Verify holding in database
-    holding = session.query(PortfolioHolding).filter_by(id=holding_id).first()
-    assert holding is not None
-    assert holding.coin == coin.upper()
-    assert holding.amount == amount
-    assert holding.purchase_price == purchase_price
-    assert holding.purchase_date == purchase_date
-    assert holding.is_active == True
-    assert holding.user_id == user_id
-    
-    # Verify trade history was created
-    trade = session.query(TradeHistory).filter_by(
-        holding_id=holding_id,
-        type="buy"
-    ).first()
-    assert trade is not None
-    assert trade.coin == coin.upper()
-    assert trade.amount == amount
-    assert trade.price == purchase_price
-    assert trade.date == purchase_date
-    assert trade.profit_loss is None  # No profit/loss on buy
-    
-    # Cleanup
-    session.close()
+    with rollback_session(db_engine) as session:
+        # Create portfolio manager
+        portfolio_manager = PortfolioManager(session, user_id)
+        
+        # Add coin to portfolio
+        holding_id = portfolio_manager.add_coin(
+            coin=coin,
+            amount=amount,
+            purchase_price=purchase_price,
+            purchase_date=purchase_date
+        )
+        
+        # Verify holding was created
+        assert holding_id is not None
+        assert isinstance(holding_id, str)
+        
+        # Verify holding in database (primary-key lookup via the identity map)
+        holding = session.get(PortfolioHolding, holding_id)
+        assert holding is not None
+        assert holding.coin == coin.upper()
+        assert holding.amount == amount
+        assert holding.purchase_price == purchase_price
+        assert holding.purchase_date == purchase_date
+        assert holding.is_active == True
+        assert holding.user_id == user_id
+        
+        # Verify trade history was created (exactly one buy)
+        trade = session.execute(
+            select(TradeHistory).where(
+                TradeHistory.holding_id == holding_id,
+                TradeHistory.type == "buy"
+            )
+        ).scalar_one()
+        assert trade.coin == coin.upper()
+        assert trade.amount == amount
+        assert trade.price == purchase_price
+        assert trade.date == purchase_date
+        assert trade.profit_loss is None  # No profit/loss on buy
 
 
 @pytest.mark.asyncio
@@ -309,6 +384,8 @@ def test_property_37_portfolio_addition(coin, amount, purchase_price, purchase_d
 )
 @settings(max_examples=100, deadline=None)
 async def test_property_38_portfolio_calculations(
+    db_engine,
+    db_user_id,
     coin,
     amount,
     purchase_price,
@@ -324,40 +401,26 @@ async def test_property_38_portfolio_calculations(
     """
     # Ensure valid price
     assume(purchase_price > 0)
+    user_id = db_user_id
     
-    # Create fresh database session
-    engine = create_engine("sqlite:///:memory:")
-    Base.metadata.create_all(engine)
-    Session = sessionmaker(bind=engine)
-    session = Session()
-    
-    # Create test user
-    user = User(
-        id=str(uuid.uuid4()),
-        email="test@example.com",
-        password_hash="hashed_password"
-    )
-    session.add(user)
-    session.commit()
-    user_id = user.id
-    
-    # Create portfolio manager
-    portfolio_manager = PortfolioManager(session, user_id)
-    
-    # Add coin to portfolio
-    holding_id = portfolio_manager.add_coin(
-        coin=coin,
-        amount=amount,
-        purchase_price=purchase_price,
-        purchase_date=datetime.utcnow()
-    )
-    
-    # Calculate current price
-    current_price = float(purchase_price) * current_price_multiplier
-    
-    # Mock price fetching
-    with patch.object(portfolio_manager.data_collector, 'fetch_price', new_callable=AsyncMock) as mock_fetch:
-        mock_fetch.return_value = current_price
+    with rollback_session(db_engine) as session:
+        # Create portfolio manager
+        portfolio_manager = PortfolioManager(session, user_id)
+        
+        # Add coin to portfolio
+        holding_id = portfolio_manager.add_coin(
+            coin=coin,
+            amount=amount,
+            purchase_price=purchase_price,
+            purchase_date=datetime.utcnow()
+        )
+        
+        # Calculate current price
+        current_price = float(purchase_price) * current_price_multiplier
+        
+        # Serve the example's price through the module-wide fetch_price stub
+        PRICE_MAP.clear()
+        PRICE_MAP[coin] = current_price
         
         # Get portfolio
         portfolio = await portfolio_manager.get_portfolio()
@@ -366,24 +429,24 @@ async def test_property_38_portfolio_calculations(
         assert len(portfolio.holdings) == 1
         holding = portfolio.holdings[0]
         
-        # Check current price
-        assert holding.current_price == pytest.approx(Decimal(str(current_price)), rel=0.0001)
+        # Check current price (converted through str() exactly as the manager does)
+        current_price_decimal = Decimal(str(current_price))
+        assert dec_close(holding.current_price, current_price_decimal)
         
         # Check current value
-        expected_value = Decimal(str(current_price)) * amount
-        assert holding.current_value == pytest.approx(expected_value, rel=0.0001)
+        expected_value = current_price_decimal * amount
+        assert dec_close(holding.current_value, expected_value)
         
         # Check profit/loss amount
         invested = purchase_price * amount
         expected_profit_loss = expected_value - invested
-        assert holding.profit_loss_amount == pytest.approx(expected_profit_loss, rel=0.0001)
+        assert dec_close(holding.profit_loss_amount, expected_profit_loss)
         
-        # Check profit/loss percent
-        expected_percent = float((expected_profit_loss / invested) * 100)
+        # Check profit/loss percent; the float comparison only needs 12 digits
+        with localcontext() as ctx:
+            ctx.prec = 12
+            expected_percent = float((expected_profit_loss / invested) * 100)
         assert holding.profit_loss_percent == pytest.approx(expected_percent, rel=0.01)
-    
-    # Cleanup
-    session.close()
 
 
 @pytest.mark.asyncio
@@ -395,6 +458,8 @@ async def test_property_38_portfolio_calculations(
 )
 @settings(max_examples=100, deadline=None)
 async def test_property_39_portfolio_total_values(
+    db_engine,
+    db_user_id,
     num_holdings,
     amounts,
     purchase_prices,
@@ -411,74 +476,81 @@ async def test_property_39_portfolio_total_values(
     # Ensure we have enough data
     num_holdings = min(num_holdings, len(amounts), len(purchase_prices), len(current_price_multipliers))
     assume(num_holdings > 0)
+    user_id = db_user_id
     
-    # Create fresh database session
-    engine = create_engine("sqlite:///:memory:")
-    Base.metadata.create_all(engine)
-    Session = sessionmaker(bind=engine)
-    session = Session()
-    
-    # Create test user
-    user = User(
-        id=str(uuid.uuid4()),
-        email="test@example.com",
-        password_hash="hashed_password"
-    )
-    session.add(user)
-    session.commit()
-    user_id = user.id
-    
-    # Create portfolio manager
-    portfolio_manager = PortfolioManager(session, user_id)
-    
-    # Add multiple holdings
-    holding_ids = []
-    expected_total_invested = Decimal("0")
-    expected_total_value = Decimal("0")
-    price_map = {}
-    
-    for i in range(num_holdings):
-        coin = SUPPORTED_COINS[i % len(SUPPORTED_COINS)]
-        amount = amounts[i]
-        purchase_price = purchase_prices[i]
+    with rollback_session(db_engine) as session:
+        # Create portfolio manager
+        portfolio_manager = PortfolioManager(session, user_id)
         
-        assume(purchase_price > 0)
+        # Add multiple holdings (add_coin itself is covered by property 37)
+        holding_rows = []
+        trade_rows = []
+        expected_total_invested = Decimal("0")
+        expected_total_value = Decimal("0")
+        price_map = {}
+        purchase_date = datetime.utcnow()
         
-        holding_id = portfolio_manager.add_coin(
-            coin=coin,
-            amount=amount,
-            purchase_price=purchase_price,
-            purchase_date=datetime.utcnow()
-        )
-        holding_ids.append(holding_id)
+        for i in range(num_holdings):
+            coin = SUPPORTED_COINS[i % len(SUPPORTED_COINS)]
+            amount = amounts[i]
+            purchase_price = purchase_prices[i]
+            
+            assume(purchase_price > 0)
+            
+            holding_id = str(uuid.uuid4())
+            holding_rows.append({
+                "id": holding_id,
+                "user_id": user_id,
+                "coin": coin,
+                "amount": amount,
+                "purchase_price": purchase_price,
+                "purchase_date": purchase_date,
+                "is_active": True
+            })
+            # Matching buy entry, as add_coin would record
+            trade_rows.append({
+                "id": str(uuid.uuid4()),
+                "user_id": user_id,
+                "holding_id": holding_id,
+                "type": "buy",
+                "coin": coin,
+                "amount": amount,
+                "price": purchase_price,
+                "date": purchase_date,
+                "profit_loss": None
+            })
+            
+            # Calculate expected values
+            current_price = float(purchase_price) * current_price_multipliers[i]
+            price_map[coin] = current_price
+            
+            expected_total_invested += purchase_price * amount
+            expected_total_value += Decimal(str(current_price)) * amount
         
-        # Calculate expected values
-        current_price = float(purchase_price) * current_price_multipliers[i]
-        price_map[coin] = current_price
+        # One executemany INSERT per table and a single commit
+        session.execute(PortfolioHolding.__table__.insert(), holding_rows)
+        session.execute(TradeHistory.__table__.insert(), trade_rows)
+        session.commit()
         
-        expected_total_invested += purchase_price * amount
-        expected_total_value += Decimal(str(current_price)) * amount
-    
-    # Mock price fetching
-    with patch.object(portfolio_manager.data_collector, 'fetch_price', new_callable=AsyncMock) as mock_fetch:
-        mock_fetch.side_effect = lambda coin: price_map.get(coin)
+        # Serve the example's prices through the module-wide fetch_price stub
+        PRICE_MAP.clear()
+        PRICE_MAP.update(price_map)
         
         # Get portfolio
         portfolio = await portfolio_manager.get_portfolio()
         
         # Verify total calculations
-        assert portfolio.total_invested == pytest.approx(expected_total_invested, rel=0.0001)
-        assert portfolio.total_value == pytest.approx(expected_total_value, rel=0.0001)
+        assert dec_close(portfolio.total_invested, expected_total_invested)
+        assert dec_close(portfolio.total_value, expected_total_value)
         
         expected_profit_loss = expected_total_value - expected_total_invested
-        assert portfolio.total_profit_loss == pytest.approx(expected_profit_loss, rel=0.0001)
+        assert dec_close(portfolio.total_profit_loss, expected_profit_loss)
         
         if expected_total_invested > 0:
-            expected_percent = float((expected_profit_loss / expected_total_invested) * 100)
+            with localcontext() as ctx:
+                ctx.prec = 12
+                expected_percent = float((expected_profit_loss / expected_total_invested) * 100)
             assert portfolio.total_profit_loss_percent == pytest.approx(expected_percent, rel=0.01)
-    
-    # Cleanup
-    session.close()
 
 
 # ============================================================================
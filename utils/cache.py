@@ -4,12 +4,40 @@ Provides caching for price, OHLCV, social media, news, and analysis data.
 """
 import redis
 import json
-from typing import Optional, Any, List, Dict
+import time
+from typing import Optional, Any, List, Dict, Tuple, Union
 from datetime import datetime, timedelta
 from utils.config import settings
 from utils.logger import logger
 
 
+def to_epoch_seconds(value: Union[int, float, str, datetime, None]) -> Optional[int]:
+    """
+    Convert a timestamp to integer Unix epoch seconds.
+    
+    Accepts epoch numbers (returned as-is), datetimes and ISO-8601 strings
+    (a trailing "Z" is allowed). Naive datetimes are taken as local time,
+    matching the collectors, which build candle and post timestamps with
+    datetime.fromtimestamp(); aware datetimes are converted from their zone.
+    
+    Args:
+        value: Timestamp in any of the supported forms
+    
+    Returns:
+        Epoch seconds, or None if the value is missing or unparseable
+    """
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return int(value)
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    return int(value.timestamp())
+
+
 class RedisCache:
     """Redis cache manager with predefined TTL settings."""
     
@@ -28,6 +56,7 @@ class RedisCache:
         # TTL settings from config
         self.ttl_price = settings.CACHE_TTL_PRICE  # 60 seconds
         self.ttl_ohlcv = settings.CACHE_TTL_OHLCV  # 300 seconds (5 minutes)
+        self.swr_ohlcv = settings.CACHE_SWR_TTL_OHLCV  # 1800 seconds stale grace period
         self.ttl_social = settings.CACHE_TTL_SOCIAL  # 3600 seconds (1 hour)
         self.ttl_news = settings.CACHE_TTL_NEWS  # 3600 seconds (1 hour)
         self.ttl_analysis = settings.CACHE_TTL_ANALYSIS  # 600 seconds (10 minutes)
@@ -67,7 +96,7 @@ class RedisCache:
             coin: Coin symbol (e.g., "BTC")
         
         Returns:
-            Dict with price and timestamp, or None if not cached
+            Dict with price and timestamp (epoch seconds), or None if not cached
         """
         key = f"price:{coin.upper()}"
         try:
@@ -92,7 +121,8 @@ class RedisCache:
         key = f"price:{coin.upper()}"
         data = {
             "price": price,
-            "timestamp": (timestamp or datetime.utcnow()).isoformat()
+            # Unix epoch seconds, so freshness checks are an int comparison
+            "timestamp": to_epoch_seconds(timestamp) if timestamp else int(time.time())
         }
         try:
             self.client.setex(key, self.ttl_price, self._serialize(data))
@@ -114,20 +144,52 @@ class RedisCache:
             timeframe: Timeframe (e.g., "1h", "4h")
         
         Returns:
-            List of OHLCV candles, or None if not cached
+            List of OHLCV candles, or None if not cached or expired
+        """
+        entry = self.get_ohlcv_entry(coin, timeframe)
+        if entry is None:
+            return None
+        data, fresh = entry
+        return data if fresh else None
+    
+    def get_ohlcv_entry(self, coin: str, timeframe: str) -> Optional[Tuple[List[Dict], bool]]:
+        """
+        Get cached OHLCV data together with its freshness.
+        
+        Entries past their expiry stay readable for the stale-while-revalidate
+        grace period (swr_ohlcv), so callers can serve them while refreshing.
+        
+        Args:
+            coin: Coin symbol
+            timeframe: Timeframe (e.g., "1h", "4h")
+        
+        Returns:
+            Tuple of (candles, is_fresh), or None if not cached
         """
         key = f"ohlcv:{coin.upper()}:{timeframe}"
         try:
-            value = self.client.get(key)
-            return self._deserialize(value)
+            entry = self._deserialize(self.client.get(key))
         except Exception as e:
             logger.error(f"Error getting OHLCV from cache: {e}")
             return None
+        
+        if entry is None:
+            return None
+        if not isinstance(entry, dict):
+            # Plain candle list written before expiry envelopes
+            return entry, True
+        # Single integer compare against the expiry stamped at write time
+        return entry["data"], entry["exp"] > int(time.time())
     
     def set_ohlcv(self, coin: str, timeframe: str, data: List[Dict]) -> bool:
         """
         Cache OHLCV data.
         
+        The candles are stored in an envelope {"exp": epoch, "data": candles}
+        whose expiry epoch lets readers reject stale data with one integer
+        comparison. The key itself lives for an extra swr_ohlcv seconds so
+        stale candles can still be served while a refresh is in flight.
+        
         Args:
             coin: Coin symbol
             timeframe: Timeframe
@@ -137,8 +199,9 @@ class RedisCache:
             True if successful, False otherwise
         """
         key = f"ohlcv:{coin.upper()}:{timeframe}"
+        entry = {"exp": int(time.time()) + self.ttl_ohlcv, "data": data}
         try:
-            self.client.setex(key, self.ttl_ohlcv, self._serialize(data))
+            self.client.setex(key, self.ttl_ohlcv + self.swr_ohlcv, self._serialize(entry))
             return True
         except Exception as e:
             logger.error(f"Error setting OHLCV in cache: {e}")
@@ -573,7 +636,10 @@ class RedisCache:
         Returns:
             List of values (None for missing keys)
         """
+        if not keys:
+            return []
         try:
+            # Single MGET round trip for all keys
             values = self.client.mget(keys)
             return [self._deserialize(v) for v in values]
         except Exception as e:
@@ -595,14 +661,15 @@ class RedisCache:
             # Serialize all values
             serialized = {k: self._serialize(v) for k, v in mapping.items()}
             
-            # Use pipeline for atomic operation
+            # Use pipeline for atomic operation (one round trip)
             pipe = self.client.pipeline()
-            pipe.mset(serialized)
-            
-            # Set TTL for each key if specified
             if ttl:
-                for key in mapping.keys():
-                    pipe.expire(key, ttl)
+                # SET with EX writes value and TTL in one command per key,
+                # instead of an MSET followed by one EXPIRE per key
+                for key, value in serialized.items():
+                    pipe.set(key, value, ex=ttl)
+            else:
+                pipe.mset(serialized)
             
             pipe.execute()
             return True
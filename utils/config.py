@@ -5,6 +5,7 @@ Loads environment variables from .env file.
 from pydantic_settings import BaseSettings
 from pydantic import field_validator
 from typing import Optional
+from functools import lru_cache
 
 
 class Settings(BaseSettings):
@@ -77,6 +78,7 @@ class Settings(BaseSettings):
     # Cache Settings
     CACHE_TTL_PRICE: int = 60
     CACHE_TTL_OHLCV: int = 300
+    CACHE_SWR_TTL_OHLCV: int = 1800
     CACHE_TTL_SOCIAL: int = 3600
     CACHE_TTL_NEWS: int = 3600
     CACHE_TTL_ANALYSIS: int = 600
@@ -128,5 +130,16 @@ class Settings(BaseSettings):
             self.CELERY_RESULT_BACKEND = self.REDIS_URL
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the process-wide Settings instance.
+    
+    Environment variables are parsed and validated once; call
+    get_settings.cache_clear() after changing them to reload.
+    """
+    return Settings()
+
+
 # Create global settings instance
-settings = Settings()
+settings = get_settings()
@@ -2,51 +2,60 @@
 Dependency checker for application startup.
 Validates that all required services and libraries are available.
 """
+import importlib.util
 import sys
-from typing import List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Tuple
 from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
 
-def check_dependencies() -> Tuple[bool, List[str]]:
+# Python packages that must be importable for the application to start
+REQUIRED_PACKAGES = [
+    'fastapi',
+    'uvicorn',
+    'pandas',
+    'numpy',
+    'talib',
+    'hypothesis',
+    'psycopg2',
+    'sqlalchemy',
+    'redis',
+    'celery',
+    'transformers',
+    'requests',
+    'aiohttp',
+    'dotenv',
+]
+
+
+@lru_cache(maxsize=1)
+def check_dependencies() -> Tuple[bool, Tuple[str, ...]]:
     """
     Check if all required dependencies are available.
     
+    The result is cached for the life of the process, since neither the
+    interpreter nor the installed packages change at runtime. Call
+    check_dependencies.cache_clear() to probe again (e.g., in tests that
+    patch sys.version_info or REQUIRED_PACKAGES).
+    
     Returns:
-        Tuple of (all_ok: bool, missing_dependencies: List[str])
+        Tuple of (all_ok: bool, missing_dependencies: Tuple[str, ...])
     """
     missing = []
     
     # Check Python version
     if sys.version_info < (3, 10):
-        missing.append(f"Python 3.10+ required (current: {sys.version_info.major}.{sys.version_info.minor})")
-    
-    # Check required packages
-    required_packages = [
-        'fastapi',
-        'uvicorn',
-        'pandas',
-        'numpy',
-        'talib',
-        'hypothesis',
-        'psycopg2',
-        'sqlalchemy',
-        'redis',
-        'celery',
-        'transformers',
-        'requests',
-        'aiohttp',
-        'dotenv',
-    ]
-    
-    for package in required_packages:
-        try:
-            __import__(package)
-        except ImportError:
+        missing.append(f"Python 3.10+ required (current: {sys.version_info[0]}.{sys.version_info[1]})")
+    
+    # Check required packages (locate only; importing would run module code)
+    for package in REQUIRED_PACKAGES:
+        if importlib.util.find_spec(package) is None:
             missing.append(f"Python package: {package}")
     
-    return len(missing) == 0, missing
+    return len(missing) == 0, tuple(missing)
 
 
 def check_database_connection() -> bool:
@@ -88,6 +97,22 @@ def check_redis_connection() -> bool:
         return False
 
 
+def check_services() -> Tuple[bool, bool]:
+    """
+    Check database and Redis connections concurrently.
+    
+    Both probes block on network I/O, so running them in parallel makes the
+    total wait max(t_db, t_redis) instead of the sum.
+    
+    Returns:
+        Tuple of (database_ok: bool, redis_ok: bool)
+    """
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        db_future = executor.submit(check_database_connection)
+        redis_future = executor.submit(check_redis_connection)
+        return db_future.result(), redis_future.result()
+
+
 def startup_checks() -> None:
     """
     Perform all startup checks and report results.
@@ -107,14 +132,15 @@ def startup_checks() -> None:
     
     logger.info("All required dependencies are installed.")
     
-    # Check database (non-critical for initial setup)
-    if check_database_connection():
+    # Check database and Redis (non-critical for initial setup)
+    db_ok, redis_ok = check_services()
+    
+    if db_ok:
         logger.info("Database connection: OK")
     else:
         logger.warning("Database connection: FAILED (will retry on first use)")
     
-    # Check Redis (non-critical for initial setup)
-    if check_redis_connection():
+    if redis_ok:
         logger.info("Redis connection: OK")
     else:
         logger.warning("Redis connection: FAILED (will retry on first use)")
@@ -0,0 +1,20 @@
+"""
+Optional Numba JIT support.
+Exposes an `njit` decorator that compiles with Numba when it is installed
+and falls back to plain Python otherwise.
+"""
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit (supports bare and called forms)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        
+        def decorator(func):
+            return func
+        
+        return decorator